@@ -11,15 +11,61 @@ Usage:
     python generate_test_data.py
 """
 
-import json
+import gzip
 import os
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import cache
+from types import MappingProxyType
+from typing import Mapping, Optional
+from urllib.parse import quote, urlencode
+
+# Output paths are shared with the live pipeline so the two can't drift apart
+from src.config import (
+    DATA_DIR,
+    OUTPUT_PATH,
+    WINDOW_7D_PATH,
+    WINDOW_30D_PATH,
+    WINDOW_SEASON_PATH,
+)
+from src.jsonio import dumps, read_json, write_atomic
+from src.performance_analyzer import (
+    GRADE_GOOD,
+    GRADE_MILESTONE,
+    GRADE_NO_DATA,
+    GRADE_ROUTINE,
+    GRADE_SOFT_FLAG,
+    GRADE_STANDOUT,
+)
+from src.window_grader import (
+    GRADE_COLD,
+    GRADE_HOT,
+    GRADE_INSUFFICIENT,
+    GRADE_QUIET,
+    GRADE_SOLID,
+)
+
+# Enum-like values repeated across every entry — one shared object each
+PRO = "Pro"
+NCAA = "NCAA"
+HITTER = "Hitter"
+PITCHER = "Pitcher"
+TWO_WAY = "Two-Way"
+FINAL = "Final"
+LIVE = "Live"
+NA = "N/A"
+
+# One timestamp for the whole run — every window entry shares it
+GENERATED_AT = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+@cache
+def social_search_url(name: str, keyword: str) -> str:
+    """Build (once per player) the X live-search link, same format as PerformanceAnalyzer."""
+    query = urlencode({"q": f'"{name}" {keyword}', "f": "live"}, quote_via=quote)
+    return f"https://x.com/search?{query}"
 
-DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
-OUTPUT_PATH = os.path.join(DATA_DIR, "current_pulse.json")
-WINDOW_7D_PATH = os.path.join(DATA_DIR, "window_7d.json")
-WINDOW_30D_PATH = os.path.join(DATA_DIR, "window_30d.json")
-WINDOW_SEASON_PATH = os.path.join(DATA_DIR, "window_season.json")
 
 # Uses real player names from the roster for realism
 TEST_PULSE = [
@@ -27,16 +73,16 @@ TEST_PULSE = [
     {
         "player_name": "Aaron Watson",
         "team": "Cincinnati Reds",
-        "level": "Pro",
+        "level": PRO,
         "stats_summary": "5.0 IP, 3 H, 0 ER, 6 K, 1 BB, W",
         "game_context": "CIN 4, PIT 1 | Final",
-        "game_status": "Final",
-        "performance_grade": "\U0001f48e Milestone",
-        "social_search_url": 'https://x.com/search?q=%22Aaron%20Watson%22%20Reds&f=live',
+        "game_status": FINAL,
+        "performance_grade": GRADE_MILESTONE,
+        "social_search_url": social_search_url("Aaron Watson", "Reds"),
         "is_client": True,
         "tags": {
-            "draft_class": "N/A",
-            "position": "Pitcher",
+            "draft_class": NA,
+            "position": PITCHER,
             "roster_priority": 2,
         },
     },
@@ -44,16 +90,16 @@ TEST_PULSE = [
     {
         "player_name": "Dax Kilby",
         "team": "New York Yankees",
-        "level": "Pro",
+        "level": PRO,
         "stats_summary": "2-4, HR, 3 RBI",
         "game_context": "NYY 6, BOS 3 | Final",
-        "game_status": "Final",
-        "performance_grade": "\U0001f525 Standout",
-        "social_search_url": 'https://x.com/search?q=%22Dax%20Kilby%22%20Yankees&f=live',
+        "game_status": FINAL,
+        "performance_grade": GRADE_STANDOUT,
+        "social_search_url": social_search_url("Dax Kilby", "Yankees"),
         "is_client": True,
         "tags": {
-            "draft_class": "N/A",
-            "position": "Hitter",
+            "draft_class": NA,
+            "position": HITTER,
             "roster_priority": 1,
         },
     },
@@ -61,16 +107,16 @@ TEST_PULSE = [
     {
         "player_name": "Garrett Whitlock",
         "team": "Boston Red Sox",
-        "level": "Pro",
+        "level": PRO,
         "stats_summary": "7.0 IP, 4 H, 1 ER, 8 K, 0 BB, W",
         "game_context": "BOS 5, TB 2 | Final",
-        "game_status": "Final",
-        "performance_grade": "\U0001f525 Standout",
-        "social_search_url": 'https://x.com/search?q=%22Garrett%20Whitlock%22%20Sox&f=live',
+        "game_status": FINAL,
+        "performance_grade": GRADE_STANDOUT,
+        "social_search_url": social_search_url("Garrett Whitlock", "Sox"),
         "is_client": True,
         "tags": {
-            "draft_class": "N/A",
-            "position": "Pitcher",
+            "draft_class": NA,
+            "position": PITCHER,
             "roster_priority": 1,
         },
     },
@@ -78,16 +124,16 @@ TEST_PULSE = [
     {
         "player_name": "Kyle Jones",
         "team": "Florida",
-        "level": "NCAA",
+        "level": NCAA,
         "stats_summary": "3-4, 2B, 2 RBI, 2 R",
         "game_context": "UF 9, UGA 3 | Final",
-        "game_status": "Final",
-        "performance_grade": "\U0001f525 Standout",
-        "social_search_url": 'https://x.com/search?q=%22Kyle%20Jones%22%20Florida&f=live',
+        "game_status": FINAL,
+        "performance_grade": GRADE_STANDOUT,
+        "social_search_url": social_search_url("Kyle Jones", "Florida"),
         "is_client": True,
         "tags": {
             "draft_class": "2026",
-            "position": "Hitter",
+            "position": HITTER,
             "roster_priority": 1,
         },
     },
@@ -95,18 +141,18 @@ TEST_PULSE = [
     {
         "player_name": "Kellon Lindsey",
         "team": "Los Angeles Dodgers",
-        "level": "Pro",
+        "level": PRO,
         "stats_summary": "2-3, RBI, R",
         "game_context": "LAD 3, SF 2 | Bot 6th",
-        "game_status": "Live",
+        "game_status": LIVE,
         "game_time": None,
         "next_game": None,
-        "performance_grade": "\u2705 Good",
-        "social_search_url": 'https://x.com/search?q=%22Kellon%20Lindsey%22%20Dodgers&f=live',
+        "performance_grade": GRADE_GOOD,
+        "social_search_url": social_search_url("Kellon Lindsey", "Dodgers"),
         "is_client": True,
         "tags": {
-            "draft_class": "N/A",
-            "position": "Hitter",
+            "draft_class": NA,
+            "position": HITTER,
             "roster_priority": 1,
         },
     },
@@ -114,16 +160,16 @@ TEST_PULSE = [
     {
         "player_name": "Myles Bailey",
         "team": "Florida State",
-        "level": "NCAA",
+        "level": NCAA,
         "stats_summary": "2-4, R",
         "game_context": "FSU 5, MIA 4 | Final",
-        "game_status": "Final",
-        "performance_grade": "\u2705 Good",
-        "social_search_url": 'https://x.com/search?q=%22Myles%20Bailey%22%20Florida%20State&f=live',
+        "game_status": FINAL,
+        "performance_grade": GRADE_GOOD,
+        "social_search_url": social_search_url("Myles Bailey", "Florida State"),
         "is_client": True,
         "tags": {
             "draft_class": "2026",
-            "position": "Hitter",
+            "position": HITTER,
             "roster_priority": 1,
         },
     },
@@ -131,16 +177,16 @@ TEST_PULSE = [
     {
         "player_name": "Sterlin Thompson",
         "team": "Colorado Rockies",
-        "level": "Pro",
+        "level": PRO,
         "stats_summary": "1-4",
         "game_context": "COL 3, ARI 7 | Final",
-        "game_status": "Final",
-        "performance_grade": "\U0001f610 Routine",
-        "social_search_url": 'https://x.com/search?q=%22Sterlin%20Thompson%22%20Rockies&f=live',
+        "game_status": FINAL,
+        "performance_grade": GRADE_ROUTINE,
+        "social_search_url": social_search_url("Sterlin Thompson", "Rockies"),
         "is_client": True,
         "tags": {
-            "draft_class": "N/A",
-            "position": "Hitter",
+            "draft_class": NA,
+            "position": HITTER,
             "roster_priority": 2,
         },
     },
@@ -148,16 +194,16 @@ TEST_PULSE = [
     {
         "player_name": "Cam Flukey",
         "team": "Coastal Carolina",
-        "level": "NCAA",
+        "level": NCAA,
         "stats_summary": "2.0 IP, 2 H, 1 ER, 2 K, 1 BB",
         "game_context": "CCU 6, JMU 5 | Final",
-        "game_status": "Final",
-        "performance_grade": "\U0001f610 Routine",
-        "social_search_url": 'https://x.com/search?q=%22Cam%20Flukey%22%20Coastal&f=live',
+        "game_status": FINAL,
+        "performance_grade": GRADE_ROUTINE,
+        "social_search_url": social_search_url("Cam Flukey", "Coastal"),
         "is_client": True,
         "tags": {
             "draft_class": "2026",
-            "position": "Pitcher",
+            "position": PITCHER,
             "roster_priority": 1,
         },
     },
@@ -165,16 +211,16 @@ TEST_PULSE = [
     {
         "player_name": "Cade Doughty",
         "team": "Toronto Blue Jays",
-        "level": "Pro",
+        "level": PRO,
         "stats_summary": "0-4",
         "game_context": "TOR 2, BAL 5 | Final",
-        "game_status": "Final",
-        "performance_grade": "\U0001f6a9 Soft Flag",
-        "social_search_url": 'https://x.com/search?q=%22Cade%20Doughty%22%20Jays&f=live',
+        "game_status": FINAL,
+        "performance_grade": GRADE_SOFT_FLAG,
+        "social_search_url": social_search_url("Cade Doughty", "Jays"),
         "is_client": True,
         "tags": {
-            "draft_class": "N/A",
-            "position": "Hitter",
+            "draft_class": NA,
+            "position": HITTER,
             "roster_priority": 2,
         },
     },
@@ -182,16 +228,16 @@ TEST_PULSE = [
     {
         "player_name": "Tanner Gordon",
         "team": "Colorado Rockies",
-        "level": "Pro",
+        "level": PRO,
         "stats_summary": "3.1 IP, 7 H, 5 ER, 2 K, 3 BB, L",
         "game_context": "COL 3, ARI 7 | Final",
-        "game_status": "Final",
-        "performance_grade": "\U0001f6a9 Soft Flag",
-        "social_search_url": 'https://x.com/search?q=%22Tanner%20Gordon%22%20Rockies&f=live',
+        "game_status": FINAL,
+        "performance_grade": GRADE_SOFT_FLAG,
+        "social_search_url": social_search_url("Tanner Gordon", "Rockies"),
         "is_client": True,
         "tags": {
-            "draft_class": "N/A",
-            "position": "Pitcher",
+            "draft_class": NA,
+            "position": PITCHER,
             "roster_priority": 2,
         },
     },
@@ -199,16 +245,16 @@ TEST_PULSE = [
     {
         "player_name": "Joe Tiroly",
         "team": "Virginia",
-        "level": "NCAA",
+        "level": NCAA,
         "stats_summary": "1-2, BB",
         "game_context": "UVA 2, VT 1 | Top 5th",
-        "game_status": "Live",
-        "performance_grade": "\U0001f610 Routine",
-        "social_search_url": 'https://x.com/search?q=%22Joe%20Tiroly%22%20Virginia&f=live',
+        "game_status": LIVE,
+        "performance_grade": GRADE_ROUTINE,
+        "social_search_url": social_search_url("Joe Tiroly", "Virginia"),
         "is_client": True,
         "tags": {
             "draft_class": "2026",
-            "position": "Hitter",
+            "position": HITTER,
             "roster_priority": 2,
         },
     },
@@ -216,10 +262,10 @@ TEST_PULSE = [
     {
         "player_name": "Aiden Robbins",
         "team": "Texas",
-        "level": "NCAA",
+        "level": NCAA,
         "stats_summary": "No game data",
         "game_context": "",
-        "game_status": "N/A",
+        "game_status": NA,
         "game_time": None,
         "next_game": {
             "date": "Fri 02/14",
@@ -229,12 +275,12 @@ TEST_PULSE = [
             "time": "7:00 PM CT",
             "display": "vs Oklahoma - Fri 02/14 7:00 PM CT"
         },
-        "performance_grade": "\u2014 No Data",
-        "social_search_url": 'https://x.com/search?q=%22Aiden%20Robbins%22%20Texas&f=live',
+        "performance_grade": GRADE_NO_DATA,
+        "social_search_url": social_search_url("Aiden Robbins", "Texas"),
         "is_client": True,
         "tags": {
             "draft_class": "2026",
-            "position": "Hitter",
+            "position": HITTER,
             "roster_priority": 1,
         },
     },
@@ -242,18 +288,18 @@ TEST_PULSE = [
     {
         "player_name": "Travis Bazzana",
         "team": "Cleveland Guardians",
-        "level": "Pro",
+        "level": PRO,
         "stats_summary": "Game at 7:10 PM ET",
         "game_context": "CLE @ DET",
         "game_status": "Scheduled",
         "game_time": "7:10 PM ET",
         "next_game": None,
-        "performance_grade": "\u2014 No Data",
-        "social_search_url": 'https://x.com/search?q=%22Travis%20Bazzana%22%20Guardians&f=live',
+        "performance_grade": GRADE_NO_DATA,
+        "social_search_url": social_search_url("Travis Bazzana", "Guardians"),
         "is_client": True,
         "tags": {
-            "draft_class": "N/A",
-            "position": "Hitter",
+            "draft_class": NA,
+            "position": HITTER,
             "roster_priority": 1,
         },
     },
@@ -262,16 +308,16 @@ TEST_PULSE = [
     {
         "player_name": "Chase Burns",
         "team": "Tennessee",
-        "level": "NCAA",
+        "level": NCAA,
         "stats_summary": "7.0 IP, 2 H, 0 ER, 12 K, 1 BB",
         "game_context": "TENN 5, BAMA 0 | Final",
-        "game_status": "Final",
-        "performance_grade": "\U0001f525 Standout",
-        "social_search_url": 'https://x.com/search?q=%22Chase%20Burns%22%20Tennessee&f=live',
+        "game_status": FINAL,
+        "performance_grade": GRADE_STANDOUT,
+        "social_search_url": social_search_url("Chase Burns", "Tennessee"),
         "is_client": False,
         "tags": {
             "draft_class": "2025",
-            "position": "Pitcher",
+            "position": PITCHER,
             "roster_priority": 1,
         },
     },
@@ -279,16 +325,16 @@ TEST_PULSE = [
     {
         "player_name": "Jac Caglianone",
         "team": "Florida",
-        "level": "NCAA",
+        "level": NCAA,
         "stats_summary": "2-4, HR, 2 RBI",
         "game_context": "UF 7, LSU 4 | Final",
-        "game_status": "Final",
-        "performance_grade": "\U0001f525 Standout",
-        "social_search_url": 'https://x.com/search?q=%22Jac%20Caglianone%22%20Florida&f=live',
+        "game_status": FINAL,
+        "performance_grade": GRADE_STANDOUT,
+        "social_search_url": social_search_url("Jac Caglianone", "Florida"),
         "is_client": False,
         "tags": {
             "draft_class": "2025",
-            "position": "Two-Way",
+            "position": TWO_WAY,
             "roster_priority": 1,
         },
     },
@@ -296,16 +342,16 @@ TEST_PULSE = [
     {
         "player_name": "Dylan Crews",
         "team": "Washington Nationals",
-        "level": "Pro",
+        "level": PRO,
         "stats_summary": "1-4, R",
         "game_context": "WSH 4, NYM 5 | Final",
-        "game_status": "Final",
-        "performance_grade": "\U0001f610 Routine",
-        "social_search_url": 'https://x.com/search?q=%22Dylan%20Crews%22%20Nationals&f=live',
+        "game_status": FINAL,
+        "performance_grade": GRADE_ROUTINE,
+        "social_search_url": social_search_url("Dylan Crews", "Nationals"),
         "is_client": False,
         "tags": {
             "draft_class": "2023",
-            "position": "Hitter",
+            "position": HITTER,
             "roster_priority": 2,
         },
     },
@@ -315,130 +361,216 @@ TEST_PULSE = [
 # =========== WINDOW TEST DATA ===========
 # Test data for 7D/30D/Season views with various grades
 
-def make_window_entry(name, team, level, is_client, position, priority, window, grade, stats, games):
+@dataclass(slots=True, frozen=True)
+class WindowTags:
+    position: str
+    draft_class: str
+    roster_priority: int
+
+
+@dataclass(slots=True, frozen=True)
+class WindowEntry:
+    """One fixed-shape window record; serialized field-by-field in declaration order."""
+
+    player_name: str
+    team: str
+    level: str
+    is_client: bool
+    tags: WindowTags
+    window: str
+    window_grade: str
+    stats: Mapping[str, object]
+    games_played: int
+    last_updated: str
+
+
+def make_window_entry(
+    name, team, level, is_client, position, priority, window, grade, stats, games,
+    generated_at=GENERATED_AT,
+):
     """Helper to create window test entries."""
-    return {
-        "player_name": name,
-        "team": team,
-        "level": level,
-        "is_client": is_client,
-        "tags": {
-            "position": position,
-            "draft_class": "N/A" if level == "Pro" else "2026",
-            "roster_priority": priority,
-        },
-        "window": window,
-        "window_grade": grade,
-        "stats": stats,
-        "games_played": games,
-        "last_updated": datetime.utcnow().isoformat() + "Z",
-    }
+    return WindowEntry(
+        player_name=name,
+        team=team,
+        level=level,
+        is_client=is_client,
+        tags=WindowTags(
+            position=position,
+            draft_class=NA if level == PRO else "2026",
+            roster_priority=priority,
+        ),
+        window=window,
+        window_grade=grade,
+        stats=stats,
+        games_played=games,
+        last_updated=generated_at,
+    )
+
 
+# Window test players, one row each:
+# (name, team, level, is_client, position, priority, grade, stats, games played per window)
+# Stats are read-only and shared by reference across all three windows.
+WINDOW_PLAYERS = [
+    # Hot hitter (Pro, Client)
+    ("Dax Kilby", "New York Yankees", PRO, True, HITTER, 1, GRADE_HOT,
+     MappingProxyType({"pa": 28, "ab": 25, "h": 12, "hr": 4, "avg": ".480", "obp": ".536", "slg": ".920", "ops": "1.456"}),
+     (7, 25, 45)),
+    # Solid hitter (Pro, Client)
+    ("Kellon Lindsey", "Los Angeles Dodgers", PRO, True, HITTER, 1, GRADE_SOLID,
+     MappingProxyType({"pa": 30, "ab": 27, "h": 9, "hr": 1, "avg": ".333", "obp": ".400", "slg": ".481", "ops": ".881"}),
+     (7, 28, 50)),
+    # Quiet hitter (Pro, Client)
+    ("Sterlin Thompson", "Colorado Rockies", PRO, True, HITTER, 2, GRADE_QUIET,
+     MappingProxyType({"pa": 25, "ab": 23, "h": 5, "hr": 0, "avg": ".217", "obp": ".280", "slg": ".261", "ops": ".541"}),
+     (6, 22, 40)),
+    # Cold hitter (Pro, Client)
+    ("Cade Doughty", "Toronto Blue Jays", PRO, True, HITTER, 2, GRADE_COLD,
+     MappingProxyType({"pa": 22, "ab": 20, "h": 3, "hr": 0, "avg": ".150", "obp": ".227", "slg": ".150", "ops": ".377"}),
+     (5, 20, 38)),
+    # Hot pitcher (Pro, Client)
+    ("Garrett Whitlock", "Boston Red Sox", PRO, True, PITCHER, 1, GRADE_HOT,
+     MappingProxyType({"ip": "14.0", "k": 18, "bb": 2, "era": "1.29", "whip": "0.79"}),
+     (2, 5, 12)),
+    # Solid pitcher (Pro, Client)
+    ("Aaron Watson", "Cincinnati Reds", PRO, True, PITCHER, 2, GRADE_SOLID,
+     MappingProxyType({"ip": "12.1", "k": 14, "bb": 4, "era": "2.92", "whip": "1.14"}),
+     (2, 4, 10)),
+    # Cold pitcher (Pro, Client)
+    ("Tanner Gordon", "Colorado Rockies", PRO, True, PITCHER, 2, GRADE_COLD,
+     MappingProxyType({"ip": "8.2", "k": 6, "bb": 5, "era": "6.23", "whip": "1.85"}),
+     (2, 4, 8)),
+    # NCAA hitter (Client)
+    ("Kyle Jones", "Florida", NCAA, True, HITTER, 1, GRADE_HOT,
+     MappingProxyType({"pa": 32, "ab": 28, "h": 14, "hr": 3, "avg": ".500", "obp": ".563", "slg": ".857", "ops": "1.420"}),
+     (8, 30, 55)),
+    # NCAA pitcher (Client)
+    ("Cam Flukey", "Coastal Carolina", NCAA, True, PITCHER, 1, GRADE_SOLID,
+     MappingProxyType({"ip": "10.0", "k": 12, "bb": 3, "era": "2.70", "whip": "1.10"}),
+     (3, 8, 15)),
+    # Following (recruit) - Hot
+    ("Chase Burns", "Tennessee", NCAA, False, PITCHER, 1, GRADE_HOT,
+     MappingProxyType({"ip": "16.0", "k": 24, "bb": 3, "era": "0.56", "whip": "0.56"}),
+     (2, 6, 14)),
+    # Following (recruit) - Solid
+    ("Jac Caglianone", "Florida", NCAA, False, HITTER, 1, GRADE_SOLID,
+     MappingProxyType({"pa": 35, "ab": 30, "h": 11, "hr": 5, "avg": ".367", "obp": ".457", "slg": ".767", "ops": "1.224"}),
+     (9, 32, 58)),
+    # Insufficient data example
+    ("Aiden Robbins", "Texas", NCAA, True, HITTER, 1, GRADE_INSUFFICIENT,
+     MappingProxyType({"pa": "--", "ab": "--", "h": "--", "hr": "--", "avg": "--", "obp": "--", "slg": "--", "ops": "--"}),
+     (2, 8, 15)),
+]
+
+# Column of the games-played tuple used for each window
+WINDOW_INDEX = {"7d": 0, "30d": 1, "season": 2}
 
-def generate_window_data(window):
-    """Generate test data for a specific time window."""
+
+def generate_window_data(window, generated_at=GENERATED_AT):
+    """Generate test data for a specific time window, stamped generated_at."""
+    i = WINDOW_INDEX[window]
     return [
-        # Hot hitter (Pro, Client)
-        make_window_entry(
-            "Dax Kilby", "New York Yankees", "Pro", True, "Hitter", 1, window,
-            "🔥 Hot",
-            {"pa": 28, "ab": 25, "h": 12, "hr": 4, "avg": ".480", "obp": ".536", "slg": ".920", "ops": "1.456"},
-            7 if window == "7d" else (25 if window == "30d" else 45)
-        ),
-        # Solid hitter (Pro, Client)
-        make_window_entry(
-            "Kellon Lindsey", "Los Angeles Dodgers", "Pro", True, "Hitter", 1, window,
-            "✅ Solid",
-            {"pa": 30, "ab": 27, "h": 9, "hr": 1, "avg": ".333", "obp": ".400", "slg": ".481", "ops": ".881"},
-            7 if window == "7d" else (28 if window == "30d" else 50)
-        ),
-        # Quiet hitter (Pro, Client)
         make_window_entry(
-            "Sterlin Thompson", "Colorado Rockies", "Pro", True, "Hitter", 2, window,
-            "😐 Quiet",
-            {"pa": 25, "ab": 23, "h": 5, "hr": 0, "avg": ".217", "obp": ".280", "slg": ".261", "ops": ".541"},
-            6 if window == "7d" else (22 if window == "30d" else 40)
-        ),
-        # Cold hitter (Pro, Client)
-        make_window_entry(
-            "Cade Doughty", "Toronto Blue Jays", "Pro", True, "Hitter", 2, window,
-            "🥶 Cold",
-            {"pa": 22, "ab": 20, "h": 3, "hr": 0, "avg": ".150", "obp": ".227", "slg": ".150", "ops": ".377"},
-            5 if window == "7d" else (20 if window == "30d" else 38)
-        ),
-        # Hot pitcher (Pro, Client)
-        make_window_entry(
-            "Garrett Whitlock", "Boston Red Sox", "Pro", True, "Pitcher", 1, window,
-            "🔥 Hot",
-            {"ip": "14.0", "k": 18, "bb": 2, "era": "1.29", "whip": "0.79"},
-            2 if window == "7d" else (5 if window == "30d" else 12)
-        ),
-        # Solid pitcher (Pro, Client)
-        make_window_entry(
-            "Aaron Watson", "Cincinnati Reds", "Pro", True, "Pitcher", 2, window,
-            "✅ Solid",
-            {"ip": "12.1", "k": 14, "bb": 4, "era": "2.92", "whip": "1.14"},
-            2 if window == "7d" else (4 if window == "30d" else 10)
-        ),
-        # Cold pitcher (Pro, Client)
-        make_window_entry(
-            "Tanner Gordon", "Colorado Rockies", "Pro", True, "Pitcher", 2, window,
-            "🥶 Cold",
-            {"ip": "8.2", "k": 6, "bb": 5, "era": "6.23", "whip": "1.85"},
-            2 if window == "7d" else (4 if window == "30d" else 8)
-        ),
-        # NCAA hitter (Client)
-        make_window_entry(
-            "Kyle Jones", "Florida", "NCAA", True, "Hitter", 1, window,
-            "🔥 Hot",
-            {"pa": 32, "ab": 28, "h": 14, "hr": 3, "avg": ".500", "obp": ".563", "slg": ".857", "ops": "1.420"},
-            8 if window == "7d" else (30 if window == "30d" else 55)
-        ),
-        # NCAA pitcher (Client)
-        make_window_entry(
-            "Cam Flukey", "Coastal Carolina", "NCAA", True, "Pitcher", 1, window,
-            "✅ Solid",
-            {"ip": "10.0", "k": 12, "bb": 3, "era": "2.70", "whip": "1.10"},
-            3 if window == "7d" else (8 if window == "30d" else 15)
-        ),
-        # Following (recruit) - Hot
-        make_window_entry(
-            "Chase Burns", "Tennessee", "NCAA", False, "Pitcher", 1, window,
-            "🔥 Hot",
-            {"ip": "16.0", "k": 24, "bb": 3, "era": "0.56", "whip": "0.56"},
-            2 if window == "7d" else (6 if window == "30d" else 14)
-        ),
-        # Following (recruit) - Solid
-        make_window_entry(
-            "Jac Caglianone", "Florida", "NCAA", False, "Hitter", 1, window,
-            "✅ Solid",
-            {"pa": 35, "ab": 30, "h": 11, "hr": 5, "avg": ".367", "obp": ".457", "slg": ".767", "ops": "1.224"},
-            9 if window == "7d" else (32 if window == "30d" else 58)
-        ),
-        # Insufficient data example
-        make_window_entry(
-            "Aiden Robbins", "Texas", "NCAA", True, "Hitter", 1, window,
-            "— Insufficient",
-            {"pa": "--", "ab": "--", "h": "--", "hr": "--", "avg": "--", "obp": "--", "slg": "--", "ops": "--"},
-            2 if window == "7d" else (8 if window == "30d" else 15)
-        ),
+            name, team, level, is_client, position, priority, window, grade, stats, games[i],
+            generated_at,
+        )
+        for name, team, level, is_client, position, priority, grade, stats, games in WINDOW_PLAYERS
     ]
 
 
+# TEST_PULSE is static, so its encoded form is built once at import
+TEST_PULSE_JSON = dumps(TEST_PULSE)
+# ...along with its .gz sidecar, compressed the way main.write_output does
+# (mtime=0, so it only changes when the JSON does)
+TEST_PULSE_GZ = gzip.compress(TEST_PULSE_JSON, compresslevel=6, mtime=0)
+
+
+def is_unchanged(path: str, payload: bytes) -> bool:
+    """True if path already holds exactly payload (size check first, then contents)."""
+    try:
+        if os.stat(path).st_size != len(payload):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == payload
+    except FileNotFoundError:
+        return False
+
+
+def write_bytes(path: str, payload: bytes) -> bool:
+    """
+    Atomically replace path with payload via jsonio.write_atomic, with the
+    data fsynced before the rename so the dashboard never sees a torn file,
+    even after a crash. The renames themselves are made durable once for
+    the whole run by sync_data_dir().
+    Skips the write entirely when the file is already up to date.
+    Returns True if the file was written.
+    """
+    if is_unchanged(path, payload):
+        return False
+    write_atomic(path, payload, fsync=True)
+    return True
+
+
+def sync_data_dir():
+    """
+    Fsync DATA_DIR once after all writes, persisting the renames: a single
+    directory barrier instead of one per file (each file's data is already
+    synced by write_bytes).
+    """
+    if not hasattr(os, "O_DIRECTORY"):  # Directory fsync isn't available on Windows
+        return
+    dir_fd = os.open(DATA_DIR, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+def _stamp_of(path: str) -> Optional[str]:
+    """The last_updated stamp of an existing window file, if it has one."""
+    try:
+        return read_json(path)[0]["last_updated"]
+    except Exception:
+        return None
+
+
+def write_window_file(window: str, path: str) -> tuple[int, bool]:
+    """
+    Generate and write one window's test data. Returns the entry count and
+    whether the file was written (False if it was already up to date).
+
+    Every entry is stamped with this run's GENERATED_AT, so the file is
+    compared as if it carried its existing stamp: one that differs only by
+    the timestamp is left alone.
+    """
+    data = generate_window_data(window)
+    stamp = _stamp_of(path)
+    if stamp is not None and is_unchanged(path, dumps(generate_window_data(window, stamp))):
+        return len(data), False
+    return len(data), write_bytes(path, dumps(data))
+
+
 def main():
-    os.makedirs(DATA_DIR, exist_ok=True)
+    # DATA_DIR itself is created once when src.config is imported
 
     # Write today's pulse data
-    with open(OUTPUT_PATH, "w") as f:
-        json.dump(TEST_PULSE, f, indent=2, ensure_ascii=False)
-    print(f"Wrote {len(TEST_PULSE)} test entries to {OUTPUT_PATH}")
-
-    # Write window data
-    for window, path in [("7d", WINDOW_7D_PATH), ("30d", WINDOW_30D_PATH), ("season", WINDOW_SEASON_PATH)]:
-        data = generate_window_data(window)
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        print(f"Wrote {len(data)} test entries to {path}")
+    if write_bytes(OUTPUT_PATH, TEST_PULSE_JSON):
+        print(f"Wrote {len(TEST_PULSE)} test entries to {OUTPUT_PATH}")
+    else:
+        print(f"{OUTPUT_PATH} already up to date")
+    # Keep the compressed copy in step with the JSON the dashboard may fetch instead
+    write_bytes(OUTPUT_PATH + ".gz", TEST_PULSE_GZ)
+
+    # Write window data (build + encode + write for each window overlaps on a small pool)
+    jobs = [("7d", WINDOW_7D_PATH), ("30d", WINDOW_30D_PATH), ("season", WINDOW_SEASON_PATH)]
+    with ThreadPoolExecutor(max_workers=len(jobs)) as ex:
+        results = list(ex.map(lambda job: write_window_file(*job), jobs))
+    for (_, path), (count, written) in zip(jobs, results):
+        if written:
+            print(f"Wrote {count} test entries to {path}")
+        else:
+            print(f"{path} already up to date")
+
+    sync_data_dir()
 
 
 if __name__ == "__main__":
@@ -5,16 +5,21 @@ Usage:
     python main.py                # Live mode (fetches roster + today's stats)
     python main.py --mock         # Load test data only (no API calls)
     python main.py --historical   # Aggregate historical stats (7D/30D/Season)
+    python main.py --pretty       # Write indented JSON instead of compact (any mode)
 """
 
 import argparse
-import json
+import gzip
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
 
-from src.alerts import check_and_send_alerts, reset_sent_alerts
+from src.alerts import check_and_send_alerts, flush_alerts, reset_sent_alerts
 from src.config import (
+    LOG_BUFFER,
     OUTPUT_PATH,
     ROSTER_URL,
     WINDOW_7D_PATH,
@@ -22,65 +27,96 @@ from src.config import (
     WINDOW_SEASON_PATH,
 )
 from src.historical_stats import WindowStatsAggregator, write_window_json
+from src.jsonio import dumps, dumps_compact, read_json, write_atomic
 from src.performance_analyzer import PerformanceAnalyzer
-from src.roster_manager import get_all_players
+from src.roster_manager import get_active_roster, get_all_players, get_recruits
 from src.stats_engine import StatsFetcher
 
 logger = logging.getLogger("pulse")
 
 
-def build_pulse_entry(player: dict, stats: dict, analysis: dict) -> dict:
+@dataclass(slots=True, frozen=True)
+class PulseEntry:
+    """One player's output record. Field order is the JSON key order."""
+
+    player_name: str
+    team: str
+    level: str
+    stats_summary: str
+    game_context: str
+    game_status: str
+    game_time: Optional[str]
+    next_game: Optional[dict]
+    performance_grade: str
+    social_search_url: str
+    is_client: bool
+    tags: dict
+
+
+def build_pulse_entry(player: dict, stats: dict, analysis: dict) -> PulseEntry:
     """Assemble a single player's output record."""
-    return {
-        "player_name": player["player_name"],
-        "team": player["team"],
-        "level": player["level"],
-        "stats_summary": stats.get("stats_summary", "No game data"),
-        "game_context": stats.get("game_context", ""),
-        "game_status": stats.get("game_status", "N/A"),
-        "game_time": stats.get("game_time"),
-        "next_game": stats.get("next_game"),
-        "performance_grade": analysis["performance_grade"],
-        "social_search_url": analysis["social_search_url"],
-        "is_client": player.get("is_client", True),
-        "tags": {
+    return PulseEntry(
+        player_name=player["player_name"],
+        team=player["team"],
+        level=player["level"],
+        stats_summary=stats.get("stats_summary", "No game data"),
+        game_context=stats.get("game_context", ""),
+        game_status=stats.get("game_status", "N/A"),
+        game_time=stats.get("game_time"),
+        next_game=stats.get("next_game"),
+        performance_grade=analysis["performance_grade"],
+        social_search_url=analysis["social_search_url"],
+        is_client=player.get("is_client", True),
+        tags={
             "draft_class": player.get("draft_class", ""),
             "position": player.get("position", ""),
             "roster_priority": player.get("roster_priority", 99),
         },
-    }
+    )
 
 
-def run_live():
+def run_live(pretty: bool = False):
     """Full pipeline: fetch roster + recruits -> fetch stats -> grade -> alert -> write JSON."""
     logger.info("Starting live pulse run")
 
     # Reset alert tracking for this run
     reset_sent_alerts()
 
-    # 1. Roster (clients + recruits)
-    all_players = get_all_players()
-    if not all_players:
-        logger.error("No players found — aborting")
-        sys.exit(1)
-
-    clients = [p for p in all_players if p.get("is_client")]
-    recruits = [p for p in all_players if not p.get("is_client")]
-    logger.info("Loaded %d clients + %d recruits", len(clients), len(recruits))
-
-    # 2. Stats + Analysis + Alerts
     fetcher = StatsFetcher()
     analyzer = PerformanceAnalyzer()
-    pulse = []
 
-    for player in all_players:
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        # 1. Roster — today's MLB games load and the recruits sheet downloads
+        #    while the client roster is fetched
+        ex.submit(fetcher.prefetch)
+        recruits_future = ex.submit(get_recruits)
+        clients = get_active_roster()
+        recruits = recruits_future.result()
+
+        # Both lists are already split by source, so counting is just len()
+        players = clients + recruits
+        if not players:
+            logger.error("No players found — aborting")
+            sys.exit(1)
+        logger.info("Loaded %d clients + %d recruits", len(clients), len(recruits))
+
+        # 2. Stats — fetched concurrently, Pro and NCAA on separate pools so
+        #    neither queues behind the other. One slot per player, in roster
+        #    order; a failed fetch leaves its slot None.
+        all_stats = fetcher.fetch_many(players)
+
+    # Keep this run's new player id lookups for the next one
+    fetcher.save_caches()
+
+    # 3. Grade + Alerts (on this thread, so alert dedupe stays single-threaded)
+    pulse: list[PulseEntry] = []
+    for player, stats in zip(players, all_stats):
+        if stats is None:  # already logged by fetch_many
+            continue
         name = player["player_name"]
         is_client = player.get("is_client", True)
         try:
-            stats = fetcher.fetch(player)
-            analysis = analyzer.analyze(player, stats)
-            entry = build_pulse_entry(player, stats, analysis)
-            pulse.append(entry)
+            entry = build_pulse_entry(player, stats, analyzer.analyze(player, stats))
 
             # Only send Slack alerts for clients, not recruits
             if is_client:
@@ -91,14 +127,18 @@ def run_live():
                 name,
                 "" if is_client else " [following]",
                 stats.get("stats_summary", "—"),
-                analysis["performance_grade"],
+                entry.performance_grade,
             )
         except Exception:
             logger.exception("Failed to process %s — skipping", name)
             continue
+        pulse.append(entry)
+
+    # 4. Post this run's alerts as one batched Slack message
+    flush_alerts()
 
-    # 3. Write output
-    write_output(pulse)
+    # 5. Write output
+    write_output(pulse, pretty=pretty)
 
 
 def run_mock():
@@ -111,8 +151,7 @@ def run_mock():
         )
         sys.exit(1)
 
-    with open(OUTPUT_PATH) as f:
-        pulse = json.load(f)
+    pulse = read_json(OUTPUT_PATH)
 
     logger.info("Loaded %d mock entries from %s", len(pulse), OUTPUT_PATH)
     # In mock mode we just validate the file exists and is loadable.
@@ -124,15 +163,24 @@ def run_mock():
         )
 
 
-def write_output(pulse: list[dict]):
-    """Write the pulse list to data/current_pulse.json."""
-    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
-    with open(OUTPUT_PATH, "w") as f:
-        json.dump(pulse, f, indent=2, ensure_ascii=False)
+def write_output(pulse: list[PulseEntry], pretty: bool = False):
+    """
+    Write the pulse list to data/current_pulse.json, plus a gzipped copy
+    (current_pulse.json.gz) for compressed delivery.
+
+    The dashboard only parses the file, so it's written compact unless
+    pretty=True (--pretty) asks for the indented, human-readable form.
+    Both files are replaced atomically, so the dashboard never reads a torn one.
+    """
+    # Encode in memory first: one write instead of json.dump's many small chunks
+    payload = dumps(pulse) if pretty else dumps_compact(pulse)
+    write_atomic(OUTPUT_PATH, payload)
+    # mtime=0 keeps the .gz byte-identical when the data hasn't changed
+    write_atomic(OUTPUT_PATH + ".gz", gzip.compress(payload, compresslevel=6, mtime=0))
     logger.info("Wrote %d entries to %s", len(pulse), OUTPUT_PATH)
 
 
-def run_historical():
+def run_historical(pretty: bool = False):
     """Aggregate historical stats for all time windows (7D/30D/Season)."""
     logger.info("Starting historical stats aggregation")
 
@@ -148,10 +196,19 @@ def run_historical():
     aggregator = WindowStatsAggregator()
     window_data = aggregator.run_all_windows(all_players)
 
-    # 3. Write separate JSON files
-    write_window_json(window_data["7d"], WINDOW_7D_PATH)
-    write_window_json(window_data["30d"], WINDOW_30D_PATH)
-    write_window_json(window_data["season"], WINDOW_SEASON_PATH)
+    # 3. Write separate JSON files — encoded and written side by side rather
+    #    than one open/write/close after another
+    outputs = {
+        WINDOW_7D_PATH: window_data["7d"],
+        WINDOW_30D_PATH: window_data["30d"],
+        WINDOW_SEASON_PATH: window_data["season"],
+    }
+    with ThreadPoolExecutor(max_workers=len(outputs)) as ex:
+        # list() so a failed write raises here instead of being dropped
+        list(ex.map(
+            lambda item: write_window_json(item[1], item[0], pretty=pretty),
+            outputs.items(),
+        ))
 
     logger.info(
         "Historical aggregation complete: 7D=%d, 30D=%d, Season=%d",
@@ -173,14 +230,24 @@ def main():
         action="store_true",
         help="Aggregate historical stats (7D/30D/Season) instead of live stats",
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Write indented JSON output files (default is compact)",
+    )
     args = parser.parse_args()
 
-    if args.mock:
-        run_mock()
-    elif args.historical:
-        run_historical()
-    else:
-        run_live()
+    try:
+        if args.mock:
+            run_mock()
+        elif args.historical:
+            run_historical(pretty=args.pretty)
+        else:
+            run_live(pretty=args.pretty)
+    finally:
+        # Drain batched log records before the run reports completion
+        if LOG_BUFFER is not None:
+            LOG_BUFFER.flush()
 
 
 if __name__ == "__main__":
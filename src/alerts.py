@@ -9,7 +9,7 @@ import logging
 import os
 from typing import Optional
 
-import requests
+from .http_session import SESSION
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +17,27 @@ logger = logging.getLogger(__name__)
 # Never hardcode webhook URLs in code — they get invalidated if exposed publicly
 SLACK_WEBHOOK_URL = os.environ.get("SLACK_WEBHOOK_URL", "")
 
+# Slack caps a single message at 50 blocks
+SLACK_MAX_BLOCKS = 50
+
 # Track alerts already sent this run to avoid duplicates
-_sent_alerts: set[str] = set()
+_sent_alerts: set[tuple[str, str]] = set()  # (player_name, alert_type)
+
+# Alerts queued this run, posted together by flush_alerts()
+_pending_alerts: list[str] = []
+
+# Alert message templates, keyed by alert type (also the dedupe key).
+# Filled with str.format_map from one per-player field dict.
+_ALERT_TEMPLATES = {
+    # Home run (any player, any tier)
+    "hr": "⚾ *{name}* ({tier}) just hit {hr_text}!\n_{team}_ — {ctx}",
+    # Pitcher enters game (any pitcher, any tier) — once, when IP > 0
+    "entered": "🔥 *{name}* ({tier}) is pitching!\n_{team}_ — {ctx}",
+    # Pitcher 5+ strikeouts (any pitcher, any tier)
+    "5k": "🎯 *{name}* ({tier}) has {k} K's!\n_{team}_ — {ctx}",
+    # T1/T2 hitter reaches base 3+ times
+    "3ob": "💪 *{name}* ({tier}) has reached base {on_base}+ times!\n_{team}_ — {summary} — {ctx}",
+}
 
 
 def send_slack_message(text: str, blocks: Optional[list] = None) -> bool:
@@ -32,7 +51,7 @@ def send_slack_message(text: str, blocks: Optional[list] = None) -> bool:
         payload["blocks"] = blocks
 
     try:
-        resp = requests.post(
+        resp = SESSION.post(
             SLACK_WEBHOOK_URL,
             json=payload,
             headers={"Content-Type": "application/json"},
@@ -49,93 +68,106 @@ def send_slack_message(text: str, blocks: Optional[list] = None) -> bool:
         return False
 
 
-def _alert_key(player_name: str, alert_type: str) -> str:
-    """Generate a unique key to track sent alerts."""
-    return f"{player_name}:{alert_type}"
+def queue_alert(text: str):
+    """Queue an alert for the next flush_alerts() batch."""
+    _pending_alerts.append(text)
+
+
+def flush_alerts() -> int:
+    """
+    Post every queued alert, batching up to SLACK_MAX_BLOCKS alerts
+    (one section block each) per webhook call. Returns the number delivered.
+    """
+    global _pending_alerts
+    # Swap in a fresh queue in one rebinding, no copy + clear
+    pending, _pending_alerts = _pending_alerts, []
+
+    delivered = 0
+    for i in range(0, len(pending), SLACK_MAX_BLOCKS):
+        batch = pending[i : i + SLACK_MAX_BLOCKS]
+        blocks = [
+            {"type": "section", "text": {"type": "mrkdwn", "text": text}}
+            for text in batch
+        ]
+        if send_slack_message("\n\n".join(batch), blocks=blocks):
+            delivered += len(batch)
+    return delivered
 
 
 def _already_sent(player_name: str, alert_type: str) -> bool:
     """Check if this alert was already sent this run."""
-    return _alert_key(player_name, alert_type) in _sent_alerts
+    return (player_name, alert_type) in _sent_alerts
 
 
 def _mark_sent(player_name: str, alert_type: str):
     """Mark an alert as sent."""
-    _sent_alerts.add(_alert_key(player_name, alert_type))
+    _sent_alerts.add((player_name, alert_type))
 
 
 def check_and_send_alerts(player: dict, stats: dict):
     """
     Check if the player's stats trigger any alert conditions.
-    Sends Slack notifications for:
+    Queues Slack notifications (sent by flush_alerts) for:
     - Any player hits a home run (any tier)
     - Any pitcher enters the game (any tier)
     - Any pitcher gets 5+ Ks (any tier)
     - T1/T2 hitter reaches base 3+ times
     """
-    name = player.get("player_name", "Unknown")
-    team = player.get("team", "")
-    tier = player.get("roster_priority", 99)
-    position = player.get("position", "Hitter")
-    game_context = stats.get("game_context", "")
-    game_status = stats.get("game_status", "N/A")
-
     # Skip if no game data
-    if game_status == "N/A":
+    if stats.get("game_status", "N/A") == "N/A":
         return
 
-    tier_label = f"T{tier}" if tier <= 4 else "T?"
-
-    # --- Alert: Home Run (any player, any tier) ---
+    # Unpack everything the conditions need once, then decide all four up front
+    tier = player.get("roster_priority", 99)
+    position = player.get("position", "Hitter")
+    pitcher_line = stats.get("is_pitcher_line", False)
+    is_pitching = pitcher_line or position == "Pitcher"
     hr = stats.get("home_runs", 0)
-    if hr > 0 and not _already_sent(name, "hr"):
-        hr_text = f"{hr} HRs" if hr > 1 else "a HR"
-        send_slack_message(
-            f"⚾ *{name}* ({tier_label}) just hit {hr_text}!\n"
-            f"_{team}_ — {game_context}"
-        )
-        _mark_sent(name, "hr")
-
-    # --- Alert: Pitcher enters game (any pitcher, any tier) ---
-    is_pitching = stats.get("is_pitcher_line", False) or position == "Pitcher"
     ip = stats.get("ip", 0.0)
-
-    if is_pitching and ip > 0 and not _already_sent(name, "entered"):
-        # Only alert once when they first appear (IP > 0)
-        send_slack_message(
-            f"🔥 *{name}* ({tier_label}) is pitching!\n"
-            f"_{team}_ — {game_context}"
-        )
-        _mark_sent(name, "entered")
-
-    # --- Alert: Pitcher 5+ strikeouts (any pitcher, any tier) ---
     strikeouts = stats.get("strikeouts", 0)
-    if is_pitching and strikeouts >= 5 and not _already_sent(name, "5k"):
-        send_slack_message(
-            f"🎯 *{name}* ({tier_label}) has {strikeouts} K's!\n"
-            f"_{team}_ — {game_context}"
-        )
-        _mark_sent(name, "5k")
-
-    # --- Alert: T1/T2 hitter reaches base 3+ times ---
-    if tier <= 2 and position in ("Hitter", "Two-Way") and not stats.get("is_pitcher_line"):
-        hits = stats.get("hits", 0)
-        # Estimate times on base: hits + walks (walks not always available, so approximate)
-        # For now, use hits + rough estimate. If we had BB data we'd add it.
-        # Using 3+ hits as proxy for "reached base 3+ times"
-        walks = stats.get("walks", 0)  # May not be populated
-        times_on_base = hits + walks
-
-        # If walks aren't tracked, check if 3+ hits as a conservative proxy
-        if times_on_base >= 3 or hits >= 3:
-            if not _already_sent(name, "3ob"):
-                send_slack_message(
-                    f"💪 *{name}* ({tier_label}) has reached base {times_on_base if times_on_base >= 3 else hits}+ times!\n"
-                    f"_{team}_ — {stats.get('stats_summary', '')} — {game_context}"
-                )
-                _mark_sent(name, "3ob")
+    hits = stats.get("hits", 0)
+    walks = stats.get("walks", 0)  # May not be populated
+    times_on_base = hits + walks
+
+    alert_hr = hr > 0
+    alert_entered = is_pitching and ip > 0
+    alert_5k = is_pitching and strikeouts >= 5
+    # Using 3+ hits as a proxy for "reached base 3+ times" when walks aren't tracked
+    alert_3ob = (
+        tier <= 2
+        and position in ("Hitter", "Two-Way")
+        and not pitcher_line
+        and (times_on_base >= 3 or hits >= 3)
+    )
+
+    # Common case: nothing to alert on
+    if not (alert_hr or alert_entered or alert_5k or alert_3ob):
+        return
+
+    name = player.get("player_name", "Unknown")
+    fields = {
+        "name": name,
+        "tier": f"T{tier}" if tier <= 4 else "T?",
+        "team": player.get("team", ""),
+        "ctx": stats.get("game_context", ""),
+        "hr_text": f"{hr} HRs" if hr > 1 else "a HR",
+        "k": strikeouts,
+        "on_base": times_on_base if times_on_base >= 3 else hits,
+        "summary": stats.get("stats_summary", ""),
+    }
+
+    for alert_type, triggered in (
+        ("hr", alert_hr),
+        ("entered", alert_entered),
+        ("5k", alert_5k),
+        ("3ob", alert_3ob),
+    ):
+        if triggered and not _already_sent(name, alert_type):
+            queue_alert(_ALERT_TEMPLATES[alert_type].format_map(fields))
+            _mark_sent(name, alert_type)
 
 
 def reset_sent_alerts():
-    """Clear the sent alerts tracker (call at start of each run)."""
+    """Clear the sent alerts tracker and alert queue (call at start of each run)."""
     _sent_alerts.clear()
+    _pending_alerts.clear()
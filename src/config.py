@@ -4,6 +4,7 @@ SV Dugout Pulse — Configuration
 
 import logging
 import os
+from logging.handlers import MemoryHandler
 
 # ---------------------------------------------------------------------------
 # Google Sheet "Publish to Web" CSV URL
@@ -66,20 +67,75 @@ WINDOW_PITCHER_HOT_ERA = 2.00
 WINDOW_PITCHER_SOLID_ERA = 3.50
 WINDOW_PITCHER_QUIET_ERA = 5.00
 
+# Same thresholds as ascending cutoff tuples, so graders can bisect once
+# instead of walking an if/elif ladder
+WINDOW_HITTER_OPS_CUTOFFS = (
+    WINDOW_HITTER_QUIET_OPS,
+    WINDOW_HITTER_SOLID_OPS,
+    WINDOW_HITTER_HOT_OPS,
+)
+WINDOW_PITCHER_ERA_CUTOFFS = (
+    WINDOW_PITCHER_HOT_ERA,
+    WINDOW_PITCHER_SOLID_ERA,
+    WINDOW_PITCHER_QUIET_ERA,
+)
+
 # Minimum sample sizes (show "--" if below threshold)
 WINDOW_MIN_PA = {"7d": 5, "30d": 20, "season": 50}
 WINDOW_MIN_IP = {"7d": 2.0, "30d": 8.0, "season": 20.0}
 
+# Recruits (non-clients) above this Tier get sparse window rows without any
+# MLB lookups; untiered recruits default to 99
+WINDOW_RECRUIT_MAX_PRIORITY = int(os.environ.get("WINDOW_RECRUIT_MAX_PRIORITY", "4"))
+
+# ---------------------------------------------------------------------------
+# Concurrency
+# ---------------------------------------------------------------------------
+# Worker threads for per-player stat fetches (network-bound, so more than CPUs)
+FETCH_WORKERS = int(os.environ.get("FETCH_WORKERS", "16"))
+# Cap on simultaneous requests to any one scraped site (ESPN, StatBroadcast,
+# D1Baseball, ...), however many fetch workers are running
+SCRAPER_HOST_CONCURRENCY = int(os.environ.get("SCRAPER_HOST_CONCURRENCY", "4"))
+# Threads shared by every NCAA player's scraper chain: room for each of the
+# three default-chain sources (ESPN, school feed, D1Baseball) to use its
+# full per-host allowance
+SCRAPER_WORKERS = int(os.environ.get("SCRAPER_WORKERS", str(3 * SCRAPER_HOST_CONCURRENCY)))
+
 # ---------------------------------------------------------------------------
 # Output
 # ---------------------------------------------------------------------------
-OUTPUT_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "current_pulse.json")
+DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "data"))
+OUTPUT_PATH = os.path.join(DATA_DIR, "current_pulse.json")
 
 # Window stats output paths
-WINDOW_7D_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "window_7d.json")
-WINDOW_30D_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "window_30d.json")
-WINDOW_SEASON_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "window_season.json")
-NCAA_BASELINES_PATH = os.path.join(os.path.dirname(__file__), "..", "data", "ncaa_baselines.json")
+WINDOW_7D_PATH = os.path.join(DATA_DIR, "window_7d.json")
+WINDOW_30D_PATH = os.path.join(DATA_DIR, "window_30d.json")
+WINDOW_SEASON_PATH = os.path.join(DATA_DIR, "window_season.json")
+NCAA_BASELINES_PATH = os.path.join(DATA_DIR, "ncaa_baselines.json")
+# Resolved MLB player ids (name -> id), committed so fresh runs skip the lookups
+PLAYER_ID_CACHE_PATH = os.path.join(DATA_DIR, "player_ids.json")
+
+# On-disk cache for MLB StatsAPI responses (kept out of data/, which is committed)
+STATSAPI_CACHE_DIR = os.environ.get(
+    "STATSAPI_CACHE_DIR",
+    os.path.normpath(os.path.join(os.path.dirname(__file__), "..", ".pulsecache")),
+)
+# Ranges that ended before today can't change; ranges including today can
+STATSAPI_CACHE_TTL_PAST = 7 * 24 * 3600  # seconds
+STATSAPI_CACHE_TTL_CURRENT = 60  # seconds
+# Name -> player id lookups only change for brand-new call-ups
+STATSAPI_CACHE_TTL_LOOKUP = 30 * 24 * 3600  # seconds
+# ...but a name with no match yet (newly signed, typo since fixed in the
+# sheet) is searched again the next day
+STATSAPI_CACHE_TTL_LOOKUP_MISS = 24 * 3600  # seconds
+
+# Last downloaded copy of each roster sheet plus its ETag/Last-Modified, for
+# conditional GETs (lives with the StatsAPI cache, outside data/)
+ROSTER_CACHE_DIR = os.path.join(STATSAPI_CACHE_DIR, "roster")
+
+# Every output above lives in DATA_DIR, so create it once here rather than
+# before each write
+os.makedirs(DATA_DIR, exist_ok=True)
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -91,3 +147,19 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
 )
+
+# Per-player INFO lines would otherwise be one stderr write each; buffer them
+# and hand them to the stream handler in batches. ERROR and above flush
+# immediately, and logging's atexit shutdown drains whatever is left.
+LOG_BUFFER_CAPACITY = 256
+
+_root_logger = logging.getLogger()
+if _root_logger.handlers and not isinstance(_root_logger.handlers[0], MemoryHandler):
+    LOG_BUFFER = MemoryHandler(
+        capacity=LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=_root_logger.handlers[0],
+    )
+    _root_logger.handlers[0] = LOG_BUFFER
+else:
+    LOG_BUFFER = None
@@ -7,26 +7,167 @@ Handles both MLB (via API) and NCAA (via baseline snapshots).
 
 from __future__ import annotations
 
-import json
 import logging
 import os
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Optional
+from operator import itemgetter
+from typing import Callable, Optional
 
 import statsapi
 
+from . import http_session  # noqa: F401 — routes statsapi through the shared pool
 from .config import (
+    FETCH_WORKERS,
     NCAA_BASELINES_PATH,
+    PLAYER_ID_CACHE_PATH,
+    STATSAPI_CACHE_TTL_CURRENT,
+    STATSAPI_CACHE_TTL_LOOKUP,
+    STATSAPI_CACHE_TTL_LOOKUP_MISS,
+    STATSAPI_CACHE_TTL_PAST,
     WINDOW_7D_PATH,
     WINDOW_30D_PATH,
     WINDOW_SEASON_PATH,
     WINDOW_MIN_IP,
     WINDOW_MIN_PA,
+    WINDOW_RECRUIT_MAX_PRIORITY,
 )
+from .jsonio import dumps, dumps_compact, loads, read_json, write_atomic
+from .response_cache import ResponseCache
 from .window_grader import grade_hitter_window, grade_pitcher_window
 
 logger = logging.getLogger(__name__)
 
+# Counting stats summed over a game log: totals key -> StatsAPI stat key
+BATTER_STAT_KEYS = {
+    "ab": "atBats",
+    "h": "hits",
+    "doubles": "doubles",
+    "triples": "triples",
+    "hr": "homeRuns",
+    "rbi": "rbi",
+    "r": "runs",
+    "bb": "baseOnBalls",
+    "k": "strikeOuts",
+    "sb": "stolenBases",
+    "hbp": "hitByPitch",
+    "sf": "sacFlies",
+}
+PITCHER_STAT_KEYS = {
+    "h": "hits",
+    "r": "runs",
+    "er": "earnedRuns",
+    "bb": "baseOnBalls",
+    "k": "strikeOuts",
+    "hr": "homeRuns",
+    "w": "wins",
+    "l": "losses",
+    "sv": "saves",
+}
+
+
+def _game_date(game: dict) -> Optional[date]:
+    """Parse a game-log split's date, or None if missing/malformed."""
+    try:
+        # fromisoformat is a fixed-format parse; strptime re-reads its
+        # format string on every call
+        return date.fromisoformat(game.get("date") or "")
+    except ValueError:
+        return None
+
+
+# Sort/search key for NCAA baseline snapshots (ISO dates sort lexicographically)
+_snapshot_date = itemgetter("date")
+
+
+def _column_totals(
+    games: list[dict],
+    stat_keys: dict[str, str],
+    derived: Optional[dict[str, Callable[[dict], int]]] = None,
+) -> dict[str, int]:
+    """
+    Sum each stat column down a game log: build one row per game, then
+    transpose with zip(*rows) so every column is summed by a single C-level
+    sum() instead of a Python += per field per game. derived adds columns
+    computed from each game's stat dict (totals key -> function), filled in
+    the same pass.
+    """
+    api_keys = tuple(stat_keys.values())
+    # One C-level call pulls every field of a stat line
+    get_row = itemgetter(*api_keys)
+    derived = derived or {}
+    derive = tuple(derived.values())
+    rows = []
+    for stat in (game.get("stat", {}) for game in games):
+        try:
+            values = get_row(stat)
+        except KeyError:
+            # Partial stat line: missing fields count as 0
+            values = tuple(stat.get(key, 0) for key in api_keys)
+        rows.append([*values, *(fn(stat) for fn in derive)])
+    columns = (*stat_keys, *derived)
+    if not rows:
+        return dict.fromkeys(columns, 0)
+    try:
+        # StatsAPI counting stats are already ints, so no per-field int()
+        sums = list(map(sum, zip(*rows)))
+    except TypeError:
+        # Some field came through as a string or null; coerce and retry
+        sums = [sum(int(v or 0) for v in column) for column in zip(*rows)]
+    return dict(zip(columns, sums))
+
+
+# IP string <-> outs, precomputed for every value a game log or season
+# total realistically holds; anything else takes the parsing path
+_IP_TO_OUTS = {f"{i}.{p}": i * 3 + p for i in range(400) for p in range(3)}
+_IP_TO_OUTS.update({str(i): i * 3 for i in range(400)})
+_OUTS_TO_IP = [f"{i // 3}.{i % 3}" if i % 3 else str(i // 3) for i in range(1200)]
+
+
+def _ip_to_outs(ip_str: str) -> int:
+    """Convert IP string (e.g., '6.1') to total outs."""
+    outs = _IP_TO_OUTS.get(ip_str)
+    if outs is not None:
+        return outs
+    try:
+        if "." in ip_str:
+            parts = ip_str.split(".")
+            return (int(parts[0]) * 3) + int(parts[1])
+        return int(float(ip_str)) * 3
+    except (ValueError, IndexError):
+        return 0
+
+
+def _stat_outs(stat: dict) -> int:
+    """Outs recorded in one game-log stat line."""
+    return _ip_to_outs(str(stat.get("inningsPitched", "0")))
+
+
+def _outs_to_ip_display(outs: int) -> str:
+    """Convert total outs to display IP (e.g., 19 outs -> '6.1')."""
+    if 0 <= outs < len(_OUTS_TO_IP):
+        return _OUTS_TO_IP[outs]
+    innings, partial = divmod(outs, 3)
+    return f"{innings}.{partial}" if partial else str(innings)
+
+
+# Slash-line rates shown in window output, in display order
+RATE_STAT_KEYS = ("avg", "obp", "slg", "ops")
+
+
+def _format_rate(x: float) -> str:
+    """
+    Format a rate stat to three places, truncated: .333, .000, 1.224.
+    Negative input (an NCAA window delta after a source corrected its
+    season totals) shows as .000.
+    """
+    n = max(int(x * 1000), 0)
+    if n < 1000:
+        return f".{n:03d}"
+    return f"{n // 1000}.{n % 1000:03d}"
+
 
 # =============================================================================
 # MLB Historical Stats
@@ -36,151 +177,144 @@ logger = logging.getLogger(__name__)
 class MLBHistoricalFetcher:
     """Fetch and aggregate MLB stats over date ranges using game logs."""
 
-    def __init__(self):
+    # Max personIds per bulk people/stats request
+    BULK_CHUNK_SIZE = 50
+
+    def __init__(self, player_cache_path: str = PLAYER_ID_CACHE_PATH):
+        self.player_cache_path = player_cache_path
         self._player_cache: dict[str, int] = {}  # name -> player_id
+        self._player_cache_dirty = False  # new ids since the last save
+        self._response_cache = ResponseCache()
+        self._load_player_cache()
 
-    def fetch_window(
-        self, player_name: str, team: str, position: str, start_date: date, end_date: date
-    ) -> Optional[dict]:
+    def _load_player_cache(self):
+        """Load name -> id mappings saved by earlier runs."""
+        if os.path.exists(self.player_cache_path):
+            try:
+                self._player_cache = read_json(self.player_cache_path)
+            except Exception:
+                logger.exception("Failed to load MLB player id cache")
+                self._player_cache = {}
+
+    def save_player_cache(self):
+        """Write the name -> id map to disk if any lookups added to it."""
+        if self._player_cache_dirty:
+            write_atomic(self.player_cache_path, dumps_compact(self._player_cache))
+            self._player_cache_dirty = False
+
+    def fetch_bulk_game_logs(
+        self, player_ids: list[int], group: str, season: int
+    ) -> dict[int, list[dict]]:
         """
-        Fetch aggregated stats for a player over the given date range.
-        Returns None if player not found or no games in range.
+        Fetch full-season game logs for many players at once.
+
+        Issues one people request per BULK_CHUNK_SIZE ids, hydrating each
+        person with the gameLog splits for the given group ("hitting" or
+        "pitching"). Returns {player_id: [game split, ...]}; players with
+        no games are omitted. Shorter windows are sliced from these logs
+        with aggregate_windows() rather than fetched separately.
         """
-        player_id = self._lookup_player(player_name)
-        if player_id is None:
-            logger.debug("MLB player not found: %s", player_name)
-            return None
+        hydrate = f"stats(group=[{group}],type=[gameLog],season={season})"
+        # A finished season is final; the current one changes daily
+        ttl = (
+            STATSAPI_CACHE_TTL_PAST if season < date.today().year
+            else STATSAPI_CACHE_TTL_CURRENT
+        )
 
-        try:
-            # Get player's game log for the date range
-            game_log = self._fetch_game_log(player_id, start_date, end_date)
-            if not game_log:
-                logger.debug("No games found for %s in range", player_name)
-                return None
-
-            # Aggregate based on position
-            is_pitcher = position == "Pitcher"
-            if is_pitcher:
-                return self._aggregate_pitcher_stats(game_log)
-            else:
-                return self._aggregate_batter_stats(game_log)
+        results: dict[int, list[dict]] = {}
+        for i in range(0, len(player_ids), self.BULK_CHUNK_SIZE):
+            chunk = player_ids[i:i + self.BULK_CHUNK_SIZE]
+            params = {
+                "personIds": ",".join(str(pid) for pid in chunk),
+                "hydrate": hydrate,
+            }
+            try:
+                data = self._response_cache.get_or_fetch(
+                    ("people", params), lambda: statsapi.get("people", params), ttl
+                )
+            except Exception:
+                logger.exception("Bulk %s stats request failed for %d players", group, len(chunk))
+                continue
 
-        except Exception:
-            logger.exception("Error fetching window stats for %s", player_name)
-            return None
+            for person in data.get("people", []):
+                for stat_group in person.get("stats", []):
+                    splits = stat_group.get("splits", [])
+                    if splits:
+                        results[person["id"]] = splits
+                    break
+
+        return results
+
+    def aggregate_windows(
+        self, game_log: list[dict], group: str, window_starts: dict[str, date], end_date: date
+    ) -> dict[str, Optional[dict]]:
+        """
+        Aggregate one game log for several windows that all end on end_date,
+        in a single pass. The windows nest, so each game is filed under the
+        narrowest window containing it, every band is summed once, and each
+        window's totals are its band plus all narrower ones.
+        Returns {window_key: stats or None (no games)}.
+        """
+        # Narrowest (latest start) first
+        order = sorted(window_starts, key=window_starts.__getitem__, reverse=True)
+        bands: list[list[dict]] = [[] for _ in order]
+        for game in game_log:
+            game_date = _game_date(game)
+            if game_date is None or game_date > end_date:
+                continue
+            for i, window_key in enumerate(order):
+                if game_date >= window_starts[window_key]:
+                    bands[i].append(game)
+                    break
+
+        if group == "pitching":
+            totals_for, finish = self._pitcher_totals, self._pitcher_stats
+        else:
+            totals_for, finish = self._batter_totals, self._batter_stats
+
+        results = {}
+        running: Optional[dict[str, int]] = None
+        games_played = 0
+        for window_key, band in zip(order, bands):
+            band_totals = totals_for(band)
+            running = band_totals if running is None else {
+                key: running[key] + band_totals[key] for key in running
+            }
+            games_played += len(band)
+            results[window_key] = finish(running, games_played) if games_played else None
+        return results
 
     def _lookup_player(self, name: str) -> Optional[int]:
-        """Search MLB for a player ID by name, with caching."""
+        """Search MLB for a player ID by name, with caching (in memory and on disk)."""
         if name in self._player_cache:
             return self._player_cache[name]
 
         try:
-            results = statsapi.lookup_player(name)
+            results = self._response_cache.get_or_fetch(
+                ("lookup_player", name),
+                lambda: statsapi.lookup_player(name),
+                STATSAPI_CACHE_TTL_LOOKUP,
+                empty_ttl=STATSAPI_CACHE_TTL_LOOKUP_MISS,
+            )
             if results:
                 player_id = results[0]["id"]
                 self._player_cache[name] = player_id
+                self._player_cache_dirty = True
                 return player_id
         except Exception:
             logger.debug("MLB player lookup failed for %s", name)
 
         return None
 
-    def _fetch_game_log(
-        self, player_id: int, start_date: date, end_date: date
-    ) -> list[dict]:
-        """
-        Fetch player's game-by-game stats for the date range.
-        Uses the stats API endpoint with gameLog type.
-        """
-        try:
-            # Format dates for API
-            start_str = start_date.strftime("%m/%d/%Y")
-            end_str = end_date.strftime("%m/%d/%Y")
-
-            # Try to get hitting stats
-            hitting_log = []
-            pitching_log = []
-
-            try:
-                hitting_data = statsapi.player_stat_data(
-                    player_id,
-                    group="hitting",
-                    type="gameLog",
-                    sportId=1,
-                )
-                if hitting_data and "stats" in hitting_data:
-                    for stat_group in hitting_data["stats"]:
-                        if stat_group.get("type", {}).get("displayName") == "gameLog":
-                            hitting_log = stat_group.get("splits", [])
-                            break
-            except Exception:
-                pass
-
-            try:
-                pitching_data = statsapi.player_stat_data(
-                    player_id,
-                    group="pitching",
-                    type="gameLog",
-                    sportId=1,
-                )
-                if pitching_data and "stats" in pitching_data:
-                    for stat_group in pitching_data["stats"]:
-                        if stat_group.get("type", {}).get("displayName") == "gameLog":
-                            pitching_log = stat_group.get("splits", [])
-                            break
-            except Exception:
-                pass
-
-            # Filter to date range
-            games = []
-            for game in hitting_log + pitching_log:
-                game_date_str = game.get("date", "")
-                if game_date_str:
-                    try:
-                        game_date = datetime.strptime(game_date_str, "%Y-%m-%d").date()
-                        if start_date <= game_date <= end_date:
-                            games.append(game)
-                    except ValueError:
-                        continue
-
-            return games
-
-        except Exception:
-            logger.exception("Error fetching game log for player %d", player_id)
-            return []
-
-    def _aggregate_batter_stats(self, games: list[dict]) -> dict:
-        """Aggregate batting stats across multiple games."""
-        totals = {
-            "pa": 0,
-            "ab": 0,
-            "h": 0,
-            "doubles": 0,
-            "triples": 0,
-            "hr": 0,
-            "rbi": 0,
-            "r": 0,
-            "bb": 0,
-            "k": 0,
-            "sb": 0,
-            "hbp": 0,
-            "sf": 0,
-        }
+    @staticmethod
+    def _batter_totals(games: list[dict]) -> dict[str, int]:
+        """Sum the batting counting stats of a list of games."""
+        return _column_totals(games, BATTER_STAT_KEYS)
 
-        for game in games:
-            stat = game.get("stat", {})
-            totals["ab"] += int(stat.get("atBats", 0))
-            totals["h"] += int(stat.get("hits", 0))
-            totals["doubles"] += int(stat.get("doubles", 0))
-            totals["triples"] += int(stat.get("triples", 0))
-            totals["hr"] += int(stat.get("homeRuns", 0))
-            totals["rbi"] += int(stat.get("rbi", 0))
-            totals["r"] += int(stat.get("runs", 0))
-            totals["bb"] += int(stat.get("baseOnBalls", 0))
-            totals["k"] += int(stat.get("strikeOuts", 0))
-            totals["sb"] += int(stat.get("stolenBases", 0))
-            totals["hbp"] += int(stat.get("hitByPitch", 0))
-            totals["sf"] += int(stat.get("sacFlies", 0))
+    @staticmethod
+    def _batter_stats(totals: dict[str, int], games_played: int) -> dict:
+        """Derive the batting line (PA, slash line) from summed counting stats."""
+        totals = dict(totals)
 
         # Calculate PA
         totals["pa"] = totals["ab"] + totals["bb"] + totals["hbp"] + totals["sf"]
@@ -198,7 +332,7 @@ class MLBHistoricalFetcher:
         ops = obp + slg
 
         return {
-            "games_played": len(games),
+            "games_played": games_played,
             "pa": totals["pa"],
             "ab": totals["ab"],
             "h": totals["h"],
@@ -215,36 +349,15 @@ class MLBHistoricalFetcher:
             "is_pitcher": False,
         }
 
-    def _aggregate_pitcher_stats(self, games: list[dict]) -> dict:
-        """Aggregate pitching stats across multiple games."""
-        totals = {
-            "outs": 0,  # Track outs for proper IP calculation
-            "h": 0,
-            "r": 0,
-            "er": 0,
-            "bb": 0,
-            "k": 0,
-            "hr": 0,
-            "w": 0,
-            "l": 0,
-            "sv": 0,
-        }
-
-        for game in games:
-            stat = game.get("stat", {})
-            # Convert IP to outs (6.1 IP = 19 outs)
-            ip_str = str(stat.get("inningsPitched", "0"))
-            totals["outs"] += self._ip_to_outs(ip_str)
-            totals["h"] += int(stat.get("hits", 0))
-            totals["r"] += int(stat.get("runs", 0))
-            totals["er"] += int(stat.get("earnedRuns", 0))
-            totals["bb"] += int(stat.get("baseOnBalls", 0))
-            totals["k"] += int(stat.get("strikeOuts", 0))
-            totals["hr"] += int(stat.get("homeRuns", 0))
-            totals["w"] += int(stat.get("wins", 0))
-            totals["l"] += int(stat.get("losses", 0))
-            totals["sv"] += int(stat.get("saves", 0))
+    @staticmethod
+    def _pitcher_totals(games: list[dict]) -> dict[str, int]:
+        """Sum the pitching counting stats (plus outs recorded) of a list of games."""
+        # Outs rather than IP, for proper IP math (6.1 IP = 19 outs)
+        return _column_totals(games, PITCHER_STAT_KEYS, {"outs": _stat_outs})
 
+    @staticmethod
+    def _pitcher_stats(totals: dict[str, int], games_played: int) -> dict:
+        """Derive IP, ERA and WHIP from summed pitching counting stats."""
         # Convert outs back to IP
         ip = totals["outs"] / 3
 
@@ -253,9 +366,9 @@ class MLBHistoricalFetcher:
         whip = (totals["bb"] + totals["h"]) / ip if ip > 0 else 0
 
         return {
-            "games_played": len(games),
+            "games_played": games_played,
             "ip": ip,
-            "ip_display": self._outs_to_ip_display(totals["outs"]),
+            "ip_display": _outs_to_ip_display(totals["outs"]),
             "h": totals["h"],
             "er": totals["er"],
             "bb": totals["bb"],
@@ -269,29 +382,6 @@ class MLBHistoricalFetcher:
             "is_pitcher": True,
         }
 
-    @staticmethod
-    def _ip_to_outs(ip_str: str) -> int:
-        """Convert IP string (e.g., '6.1') to total outs."""
-        try:
-            if "." in ip_str:
-                parts = ip_str.split(".")
-                innings = int(parts[0])
-                partial = int(parts[1]) if len(parts) > 1 else 0
-                return (innings * 3) + partial
-            else:
-                return int(float(ip_str)) * 3
-        except (ValueError, IndexError):
-            return 0
-
-    @staticmethod
-    def _outs_to_ip_display(outs: int) -> str:
-        """Convert total outs to display IP (e.g., 19 outs -> '6.1')."""
-        innings = outs // 3
-        partial = outs % 3
-        if partial == 0:
-            return str(innings)
-        return f"{innings}.{partial}"
-
 
 # =============================================================================
 # NCAA Baseline Management
@@ -305,81 +395,144 @@ class NCAABaselineManager:
     NCAA sources provide cumulative season stats, not daily game logs.
     We store daily snapshots and calculate window stats as:
         window_stats = current_cumulative - baseline_from_N_days_ago
+
+    On disk, the baselines JSON is a compacted base and a sibling .jsonl
+    log holds the snapshots stored since. flush() appends only the new
+    records to the log, and folds everything back into the JSON once the
+    log outgrows it.
     """
 
+    # Rewrite the JSON once the log is this many times its size
+    COMPACT_RATIO = 4
+    # ...but never for a log smaller than this
+    COMPACT_MIN_BYTES = 64 * 1024
+
     def __init__(self, baselines_path: str = NCAA_BASELINES_PATH):
         self.baselines_path = baselines_path
+        self.log_path = os.path.splitext(baselines_path)[0] + ".jsonl"
         self._baselines: dict = {}
+        self._pending: list[dict] = []  # stored since the last flush(), not yet logged
         self._load_baselines()
 
     def _load_baselines(self):
         """Load existing baselines from disk."""
         if os.path.exists(self.baselines_path):
             try:
-                with open(self.baselines_path) as f:
-                    self._baselines = json.load(f)
+                self._baselines = read_json(self.baselines_path)
             except Exception:
                 logger.exception("Failed to load NCAA baselines")
                 self._baselines = {}
 
+        # Snapshots are kept sorted by date so lookups can bisect
+        for entry in self._baselines.values():
+            entry.get("snapshots", []).sort(key=_snapshot_date)
+
+        # Replay snapshots stored since the last compaction. Replaying a
+        # record twice is harmless, so a crash between compacting and
+        # removing the log loses nothing.
+        if os.path.exists(self.log_path):
+            with open(self.log_path, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = loads(line)
+                    except ValueError:
+                        # A run killed mid-append leaves a partial last line
+                        logger.warning("Skipping unreadable NCAA baseline log line")
+                        continue
+                    self._apply(record)
+
     def _save_baselines(self):
-        """Persist baselines to disk."""
-        os.makedirs(os.path.dirname(self.baselines_path), exist_ok=True)
-        with open(self.baselines_path, "w") as f:
-            json.dump(self._baselines, f, indent=2)
+        """
+        Persist baselines to disk (compact JSON). Written to a temp file in
+        the same directory and swapped in with os.replace, so a crash never
+        leaves a half-written file.
+        """
+        write_atomic(self.baselines_path, dumps_compact(self._baselines))
+
+    def flush(self):
+        """Append snapshots stored since the last flush to the log, compacting if due."""
+        if not self._pending:
+            return
+        payload = b"".join(dumps_compact(record) + b"\n" for record in self._pending)
+        with open(self.log_path, "a+b") as f:
+            # Start on a fresh line if an earlier run died mid-append
+            if f.seek(0, os.SEEK_END):
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    payload = b"\n" + payload
+            f.write(payload)
+        self._pending = []
+
+        log_size = os.path.getsize(self.log_path)
+        base_size = os.path.getsize(self.baselines_path) if os.path.exists(self.baselines_path) else 0
+        if log_size > max(self.COMPACT_RATIO * base_size, self.COMPACT_MIN_BYTES):
+            self.compact()
+
+    def compact(self):
+        """Fold the log into the baselines JSON and start a fresh log."""
+        self._save_baselines()
+        if os.path.exists(self.log_path):
+            os.remove(self.log_path)
 
     def _player_key(self, player_name: str, team: str) -> str:
         """Generate unique key for a player."""
         return f"{player_name}|{team}"
 
     def store_baseline(
-        self, player_name: str, team: str, stats: dict, as_of_date: date
+        self,
+        player_name: str,
+        team: str,
+        stats: dict,
+        as_of_date: date,
+        today: Optional[date] = None,
     ):
-        """Store today's cumulative stats as a baseline snapshot."""
-        key = self._player_key(player_name, team)
-        date_str = as_of_date.isoformat()
+        """
+        Store today's cumulative stats as a baseline snapshot.
+        Pass today when storing for many players so date.today() isn't re-read per call.
+        """
+        record = {
+            "key": self._player_key(player_name, team),
+            "date": as_of_date.isoformat(),
+            "cumulative": stats,
+            # Keep only last 45 days of snapshots
+            "cutoff": ((today or date.today()) - timedelta(days=45)).isoformat(),
+        }
+        self._apply(record)
 
-        if key not in self._baselines:
-            self._baselines[key] = {"snapshots": []}
+        # Logged once per batch by flush(), not per player
+        self._pending.append(record)
 
-        # Remove old snapshot for same date if exists
-        self._baselines[key]["snapshots"] = [
-            s for s in self._baselines[key]["snapshots"] if s["date"] != date_str
-        ]
+    def _apply(self, record: dict):
+        """Insert one stored snapshot record and drop snapshots before its cutoff."""
+        date_str = record["date"]
+        snapshots = self._baselines.setdefault(record["key"], {"snapshots": []})["snapshots"]
+        snapshot = {"date": date_str, "cumulative": record["cumulative"]}
 
-        # Add new snapshot
-        self._baselines[key]["snapshots"].append({
-            "date": date_str,
-            "cumulative": stats,
-        })
-
-        # Keep only last 45 days of snapshots
-        cutoff = (date.today() - timedelta(days=45)).isoformat()
-        self._baselines[key]["snapshots"] = [
-            s for s in self._baselines[key]["snapshots"] if s["date"] >= cutoff
-        ]
+        # Insert in date order, replacing an old snapshot for the same date
+        i = bisect_left(snapshots, date_str, key=_snapshot_date)
+        if i < len(snapshots) and snapshots[i]["date"] == date_str:
+            snapshots[i] = snapshot
+        else:
+            snapshots.insert(i, snapshot)
 
-        self._save_baselines()
+        del snapshots[:bisect_left(snapshots, record["cutoff"], key=_snapshot_date)]
 
     def get_baseline(
-        self, player_name: str, team: str, days_ago: int
+        self, player_name: str, team: str, days_ago: int, today: Optional[date] = None
     ) -> Optional[dict]:
-        """Retrieve baseline from N days ago for delta calculation."""
+        """Retrieve baseline from N days ago (relative to today) for delta calculation."""
         key = self._player_key(player_name, team)
         if key not in self._baselines:
             return None
 
-        target_date = (date.today() - timedelta(days=days_ago)).isoformat()
+        target_date = ((today or date.today()) - timedelta(days=days_ago)).isoformat()
         snapshots = self._baselines[key].get("snapshots", [])
 
         # Find closest snapshot on or before target date
-        best = None
-        for snap in snapshots:
-            if snap["date"] <= target_date:
-                if best is None or snap["date"] > best["date"]:
-                    best = snap
-
-        return best["cumulative"] if best else None
+        i = bisect_right(snapshots, target_date, key=_snapshot_date) - 1
+        return snapshots[i]["cumulative"] if i >= 0 else None
 
     def calculate_window_stats(
         self, current: dict, baseline: Optional[dict], position: str
@@ -395,8 +548,8 @@ class NCAABaselineManager:
 
         if is_pitcher:
             # Calculate pitcher deltas
-            ip_current = self._ip_to_outs(str(current.get("ip", 0)))
-            ip_baseline = self._ip_to_outs(str(baseline.get("ip", 0)))
+            ip_current = _ip_to_outs(str(current.get("ip", 0)))
+            ip_baseline = _ip_to_outs(str(baseline.get("ip", 0)))
             outs = ip_current - ip_baseline
             ip = outs / 3
 
@@ -410,7 +563,7 @@ class NCAABaselineManager:
 
             return {
                 "ip": ip,
-                "ip_display": self._outs_to_ip_display(outs),
+                "ip_display": _outs_to_ip_display(outs),
                 "k": k,
                 "bb": bb,
                 "h": h,
@@ -450,30 +603,42 @@ class NCAABaselineManager:
                 "is_pitcher": False,
             }
 
-    @staticmethod
-    def _ip_to_outs(ip_str: str) -> int:
-        """Convert IP string to outs."""
-        try:
-            if "." in ip_str:
-                parts = ip_str.split(".")
-                return (int(parts[0]) * 3) + int(parts[1])
-            return int(float(ip_str)) * 3
-        except (ValueError, IndexError):
-            return 0
-
-    @staticmethod
-    def _outs_to_ip_display(outs: int) -> str:
-        """Convert outs to display IP."""
-        innings = outs // 3
-        partial = outs % 3
-        return f"{innings}.{partial}" if partial else str(innings)
-
 
 # =============================================================================
 # Window Stats Aggregator
 # =============================================================================
 
 
+@dataclass(slots=True, frozen=True)
+class PlayerView:
+    """A roster player's fields, resolved once per run rather than once per window."""
+
+    name: str
+    team: str
+    level: str
+    position: str
+    is_client: bool
+    roster_priority: int
+    tags: dict
+
+    @classmethod
+    def from_player(cls, player: dict) -> PlayerView:
+        position = player.get("position", "") or player.get("tags", {}).get("position", "Hitter")
+        return cls(
+            name=player.get("player_name", ""),
+            team=player.get("team", ""),
+            level=player.get("level", ""),
+            position=position,
+            is_client=player.get("is_client", True),
+            roster_priority=player.get("roster_priority", 99),
+            tags=player.get("tags", {
+                "position": position,
+                "draft_class": player.get("draft_class", "N/A"),
+                "roster_priority": player.get("roster_priority", 99),
+            }),
+        )
+
+
 class WindowStatsAggregator:
     """Orchestrate historical stats for all players across all windows."""
 
@@ -491,6 +656,14 @@ class WindowStatsAggregator:
         self._season_start = date(self._today.year, 2, 1)  # Feb 1
         if self._today < self._season_start:
             self._season_start = date(self._today.year - 1, 2, 1)
+        # Window start dates are the same for every player, so compute them once
+        self._window_starts = {
+            window_key: (
+                self._season_start if window_key == "season"
+                else self._today - timedelta(days=days)
+            )
+            for window_key, days in self.WINDOWS.items()
+        }
 
     def run_all_windows(self, players: list[dict]) -> dict[str, list]:
         """
@@ -499,47 +672,115 @@ class WindowStatsAggregator:
         """
         results = {"7d": [], "30d": [], "season": []}
 
-        for player in players:
-            name = player.get("player_name", "")
-            team = player.get("team", "")
-            level = player.get("level", "")
-            position = player.get("position", "") or player.get("tags", {}).get("position", "Hitter")
-            is_client = player.get("is_client", True)
-
-            logger.info("Processing windows for %s (%s)", name, level)
+        views = [PlayerView.from_player(player) for player in players]
+        pro_ids = self._resolve_pro_ids(views)
+
+        # The network-bound part: one season of game logs per Pro player;
+        # all windows are then aggregated from it in one pass per player
+        pro_logs = self._fetch_pro_logs(pro_ids)
+        pro_windows = {
+            name: self.mlb_fetcher.aggregate_windows(
+                game_log, group, self._window_starts, self._today
+            )
+            for name, (group, game_log) in pro_logs.items()
+        }
 
-            for window_key, days in self.WINDOWS.items():
-                if window_key == "season":
-                    start_date = self._season_start
-                else:
-                    start_date = self._today - timedelta(days=days)
+        for window_key, start_date in self._window_starts.items():
+            pro_stats = {
+                name: windows[window_key]
+                for name, windows in pro_windows.items()
+                if windows[window_key] is not None
+            }
+            logger.info("Window %s: %d Pro players with stats", window_key, len(pro_stats))
 
+            for view in views:
                 entry = self._build_window_entry(
-                    player, window_key, start_date, self._today
+                    view, window_key, start_date, self._today, pro_stats
                 )
                 if entry:
                     results[window_key].append(entry)
 
+        # One baselines write and one player-id write for the whole run
+        self.ncaa_manager.flush()
+        self.mlb_fetcher.save_player_cache()
+
         return results
 
+    def _resolve_pro_ids(self, views: list[PlayerView]) -> dict[str, tuple[int, str]]:
+        """
+        Map each Pro player's name to (MLB id, stat group). Name lookups are
+        one HTTP call each, so the unique names are resolved concurrently.
+        Low-priority recruits are left out before any request is made; they
+        get sparse entries like players with no games.
+        """
+        groups = {
+            view.name: "pitching" if view.position == "Pitcher" else "hitting"
+            for view in views
+            if view.level == "Pro"
+            and (view.is_client or view.roster_priority <= WINDOW_RECRUIT_MAX_PRIORITY)
+        }
+
+        with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+            player_ids = ex.map(self.mlb_fetcher._lookup_player, groups)
+
+        pro_ids = {}
+        for (name, group), player_id in zip(groups.items(), player_ids):
+            if player_id is None:
+                logger.debug("MLB player not found: %s", name)
+                continue
+            pro_ids[name] = (player_id, group)
+        return pro_ids
+
+    def _fetch_pro_logs(
+        self, pro_ids: dict[str, tuple[int, str]]
+    ) -> dict[str, tuple[str, list[dict]]]:
+        """
+        Bulk-fetch this season's game logs for all Pro players, the hitting
+        and pitching request sets side by side. Returns {name: (group, games)}.
+        """
+        season = self._season_start.year
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            futures = [
+                ex.submit(
+                    self.mlb_fetcher.fetch_bulk_game_logs,
+                    [pid for pid, g in pro_ids.values() if g == group],
+                    group,
+                    season,
+                )
+                for group in ("hitting", "pitching")
+            ]
+            by_id: dict[int, list[dict]] = {}
+            for future in futures:
+                by_id.update(future.result())
+
+        return {
+            name: (group, by_id[pid])
+            for name, (pid, group) in pro_ids.items()
+            if pid in by_id
+        }
+
     def _build_window_entry(
-        self, player: dict, window: str, start_date: date, end_date: date
+        self,
+        view: PlayerView,
+        window: str,
+        start_date: date,
+        end_date: date,
+        pro_stats: dict[str, dict],
     ) -> Optional[dict]:
-        """Build a single window stats entry for a player."""
-        name = player.get("player_name", "")
-        team = player.get("team", "")
-        level = player.get("level", "")
-        position = player.get("position", "") or player.get("tags", {}).get("position", "Hitter")
-        is_client = player.get("is_client", True)
+        """
+        Build a single window stats entry for a player. Pro stats come from
+        pro_stats (name -> this window's aggregate, from the bulk game logs).
+        """
+        name, team, level, position = view.name, view.team, view.level, view.position
 
         # Fetch stats based on level
         if level == "Pro":
-            stats = self.mlb_fetcher.fetch_window(name, team, position, start_date, end_date)
+            stats = pro_stats.get(name)
         elif level == "NCAA":
             # NCAA uses baseline deltas
             days_ago = (end_date - start_date).days
-            baseline = self.ncaa_manager.get_baseline(name, team, days_ago)
-            current = self.ncaa_manager.get_baseline(name, team, 0)
+            baseline = self.ncaa_manager.get_baseline(name, team, days_ago, today=end_date)
+            current = self.ncaa_manager.get_baseline(name, team, 0, today=end_date)
             stats = self.ncaa_manager.calculate_window_stats(current, baseline, position) if current else None
         else:
             stats = None
@@ -558,12 +799,8 @@ class WindowStatsAggregator:
             "player_name": name,
             "team": team,
             "level": level,
-            "is_client": is_client,
-            "tags": player.get("tags", {
-                "position": position,
-                "draft_class": player.get("draft_class", "N/A"),
-                "roster_priority": player.get("roster_priority", 99),
-            }),
+            "is_client": view.is_client,
+            "tags": view.tags,
             "window": window,
             "window_grade": grade,
             "stats": formatted,
@@ -605,16 +842,17 @@ class WindowStatsAggregator:
             min_pa = WINDOW_MIN_PA.get(window, 5)
             sparse = pa < min_pa
 
-            return {
-                "pa": stats.get("pa", 0) if not sparse else "--",
-                "ab": stats.get("ab", 0) if not sparse else "--",
-                "h": stats.get("h", 0) if not sparse else "--",
-                "hr": stats.get("hr", 0) if not sparse else "--",
-                "avg": f".{int(stats.get('avg', 0) * 1000):03d}"[1:] if not sparse else "--",
-                "obp": f".{int(stats.get('obp', 0) * 1000):03d}"[1:] if not sparse else "--",
-                "slg": f".{int(stats.get('slg', 0) * 1000):03d}"[1:] if not sparse else "--",
-                "ops": f".{int(stats.get('ops', 0) * 1000):03d}"[1:] if not sparse else "--",
+            if sparse:
+                return dict.fromkeys(("pa", "ab", "h", "hr", *RATE_STAT_KEYS), "--")
+
+            formatted = {
+                "pa": stats.get("pa", 0),
+                "ab": stats.get("ab", 0),
+                "h": stats.get("h", 0),
+                "hr": stats.get("hr", 0),
             }
+            formatted.update((key, _format_rate(stats.get(key, 0))) for key in RATE_STAT_KEYS)
+            return formatted
 
     def _calculate_grade(self, stats: dict, window: str, position: str) -> str:
         """Calculate window grade based on stats."""
@@ -634,9 +872,12 @@ class WindowStatsAggregator:
             return grade_hitter_window(stats, window)
 
 
-def write_window_json(data: list, path: str):
-    """Write window stats to JSON file."""
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+def write_window_json(data: list, path: str, pretty: bool = False):
+    """
+    Write window stats to JSON file (compact unless pretty=True), replacing
+    it atomically so the dashboard never reads a half-written file.
+    """
+    # Encode in memory first: one write instead of json.dump's many small chunks
+    payload = dumps(data) if pretty else dumps_compact(data)
+    write_atomic(path, payload)
     logger.info("Wrote %d entries to %s", len(data), path)
@@ -0,0 +1,97 @@
+"""
+SV Dugout Pulse — Shared HTTP Session
+
+One pooled requests.Session for every outbound call (roster sheets, MLB
+StatsAPI, stat scrapers, Slack), so keep-alive connections and TLS
+sessions are reused across players and across the fetch worker threads
+instead of re-handshaking per request.
+"""
+
+import threading
+from urllib.parse import urlsplit
+
+import requests
+import statsapi
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import FETCH_WORKERS, SCRAPER_HOST_CONCURRENCY
+from .jsonio import loads
+
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After, but never parks a worker for long."""
+
+    MAX_RETRY_AFTER = 30  # seconds
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, self.MAX_RETRY_AFTER)
+
+
+class _FastJSONResponse(requests.Response):
+    """Response whose .json() decodes through jsonio (orjson when installed)."""
+
+    def json(self, **kwargs):
+        if kwargs:  # stdlib-only options (object_hook, ...) keep the stock path
+            return super().json(**kwargs)
+        return loads(self.content)
+
+
+class _FastJSONAdapter(HTTPAdapter):
+    """HTTPAdapter that hands back _FastJSONResponse objects."""
+
+    def build_response(self, req, resp):
+        response = super().build_response(req, resp)
+        response.__class__ = _FastJSONResponse
+        return response
+
+
+def build_session() -> requests.Session:
+    """Create a Session whose connection pool is sized for the fetch workers."""
+    session = requests.Session()
+    # Identify ourselves once instead of per request
+    session.headers["User-Agent"] = f"sv-dugout-pulse ({requests.utils.default_user_agent()})"
+    # Pin compressed transfers explicitly (urllib3 always decodes these two),
+    # rather than relying on whatever the installed requests defaults to
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    # Boxscores and game logs are large JSON bodies; every caller's r.json()
+    # (statsapi's included) decodes them with orjson instead of stdlib json
+    adapter = _FastJSONAdapter(
+        pool_connections=8,  # distinct hosts kept warm
+        pool_maxsize=FETCH_WORKERS,  # concurrent connections per host
+        # Retry connection errors, rate limits and transient 5xx on idempotent
+        # requests only, with exponential backoff (or the server's Retry-After)
+        # between tries (urllib3's default method allow-list excludes POST, so
+        # Slack posts never repeat)
+        max_retries=_CappedRetry(
+            total=2, backoff_factor=0.3, status_forcelist=(429, 502, 503, 504)
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = build_session()
+
+# statsapi makes every call via requests.get() on its own module-level
+# `requests`; pointing that at SESSION puts the MLB calls in the same pool
+statsapi.requests = SESSION
+
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_slots_guard = threading.Lock()
+
+
+def throttled_get(url: str, **kwargs) -> requests.Response:
+    """
+    SESSION.get, but holding one of the host's SCRAPER_HOST_CONCURRENCY slots
+    so a batch of concurrent player fetches can't hammer a single site.
+    """
+    host = urlsplit(url).netloc
+    with _host_slots_guard:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(SCRAPER_HOST_CONCURRENCY)
+    with slot:
+        return SESSION.get(url, **kwargs)
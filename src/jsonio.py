@@ -0,0 +1,89 @@
+"""
+SV Dugout Pulse — JSON I/O
+
+Fast JSON encode/decode for the data/*.json files: orjson when it's
+installed, the stdlib json module otherwise. Both paths produce the same
+non-ASCII-preserving UTF-8 bytes, either 2-space-indented or compact.
+Dataclass records are encoded field-by-field, in declaration order, and
+read-only mappings (MappingProxyType) as plain dicts.
+"""
+
+import json
+import os
+import tempfile
+from dataclasses import fields, is_dataclass
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json when the extension isn't installed
+    orjson = None
+
+
+def _json_default(obj):
+    """
+    Encode the frozen record types: dataclasses field-by-field (orjson
+    handles these natively), read-only mappings as dicts.
+    """
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# Stdlib fallback encoders, configured once rather than rebuilt by every json.dumps call
+_JSON_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, default=_json_default)
+_COMPACT_ENCODER = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False, default=_json_default
+)
+
+
+def dumps(data) -> bytes:
+    """Serialize to pretty-printed UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_INDENT_2)
+    return _JSON_ENCODER.encode(data).encode("utf-8")
+
+
+def dumps_compact(data) -> bytes:
+    """Serialize to compact (no whitespace) UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default)
+    return _COMPACT_ENCODER.encode(data).encode("utf-8")
+
+
+def loads(payload: bytes | str):
+    """Deserialize JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def read_json(path: str):
+    """Read and decode a JSON file in one read."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def write_atomic(path: str, payload: bytes, fsync: bool = False):
+    """
+    Write payload via a temp file + os.replace, so readers never see a
+    partial file. fsync=True also flushes the data to disk before the
+    rename, so the file can't come back empty or torn after a crash.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        # mkstemp creates the file owner-only; keep outputs world-readable
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
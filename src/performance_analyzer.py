@@ -5,6 +5,7 @@ Takes raw stats and assigns a performance_grade plus a social search URL.
 """
 
 import logging
+from functools import lru_cache
 from urllib.parse import quote
 
 from .config import (
@@ -27,6 +28,18 @@ GRADE_SOFT_FLAG = "\U0001f6a9 Soft Flag"
 GRADE_SCHEDULED = "\U0001f552 Scheduled"
 GRADE_NO_DATA = "\u2014 No Data"
 
+# Game statuses that decide the grade before any stat line is read
+_STATUS_GRADES = {"N/A": GRADE_NO_DATA, "Scheduled": GRADE_SCHEDULED}
+
+
+@lru_cache(maxsize=4096)
+def _social_url(name: str, team: str) -> str:
+    """X live-search link for a player; cached since the roster repeats every run."""
+    # Use just the main team name keyword (e.g., "Yankees" not "New York Yankees")
+    team_keyword = team.split()[-1] if team else ""
+    query = f'"{name}" {team_keyword}'.strip()
+    return f"https://x.com/search?q={quote(query)}&f=live"
+
 
 class PerformanceAnalyzer:
     """Analyze a player's daily stats and assign a performance grade."""
@@ -48,28 +61,19 @@ class PerformanceAnalyzer:
     # ----- Grading logic -----
 
     def _grade(self, player: dict, stats: dict) -> str:
-        if stats.get("game_status") == "N/A":
-            return GRADE_NO_DATA
-
-        if stats.get("game_status") == "Scheduled":
-            return GRADE_SCHEDULED
+        status_grade = _STATUS_GRADES.get(stats.get("game_status"))
+        if status_grade is not None:
+            return status_grade
 
         # Milestone always takes priority
-        if stats.get("is_debut"):
-            return GRADE_MILESTONE
-        if stats.get("milestone_label"):
+        if stats.get("is_debut") or stats.get("milestone_label"):
             return GRADE_MILESTONE
 
-        position = player.get("position", "Hitter")
-        if position == "Pitcher" or stats.get("is_pitcher_line"):
+        # Pitchers, and anyone (e.g. a Two-Way player) with a pitching line
+        # today, are graded as pitchers; everyone else on their batting line
+        if player.get("position", "Hitter") == "Pitcher" or stats.get("is_pitcher_line"):
             return self._grade_pitcher(stats)
-        elif position == "Two-Way":
-            # Grade whichever line they have today
-            if stats.get("is_pitcher_line"):
-                return self._grade_pitcher(stats)
-            return self._grade_hitter(stats)
-        else:
-            return self._grade_hitter(stats)
+        return self._grade_hitter(stats)
 
     def _grade_hitter(self, stats: dict) -> str:
         hits = stats.get("hits", 0)
@@ -118,9 +122,4 @@ class PerformanceAnalyzer:
 
     @staticmethod
     def _build_social_url(player: dict) -> str:
-        name = player.get("player_name", "")
-        team = player.get("team", "")
-        # Use just the main team name keyword (e.g., "Yankees" not "New York Yankees")
-        team_keyword = team.split()[-1] if team else ""
-        query = f'"{name}" {team_keyword}'.strip()
-        return f"https://x.com/search?q={quote(query)}&f=live"
+        return _social_url(player.get("player_name", ""), player.get("team", ""))
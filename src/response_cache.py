@@ -0,0 +1,90 @@
+"""
+SV Dugout Pulse — Response Cache
+
+A small on-disk TTL cache for MLB StatsAPI responses, so finished games
+aren't re-downloaded on every run. Entries are one JSON file each under
+STATSAPI_CACHE_DIR (named by a hash of the request), fronted by an
+in-process dict so repeat lookups in the same run skip the disk too.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+from .config import STATSAPI_CACHE_DIR
+from .jsonio import dumps_compact, loads
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """File-per-entry TTL cache keyed by any JSON-serializable request key."""
+
+    def __init__(self, directory: str = STATSAPI_CACHE_DIR):
+        self.directory = directory
+        self._memory: dict[str, tuple[float, object]] = {}  # digest -> (expires, value)
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def _digest(key) -> str:
+        return hashlib.sha1(dumps_compact(key)).hexdigest()
+
+    def get(self, key) -> Optional[object]:
+        """Return the cached value for key, or None if missing/expired."""
+        digest = self._digest(key)
+        now = time.time()
+
+        with self._lock:
+            hit = self._memory.get(digest)
+        if hit is not None:
+            expires, value = hit
+            return value if expires > now else None
+
+        try:
+            with open(os.path.join(self.directory, digest), "rb") as f:
+                record = loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.debug("Unreadable cache entry %s — ignoring", digest)
+            return None
+
+        if record["expires"] <= now:
+            return None
+        with self._lock:
+            self._memory[digest] = (record["expires"], record["value"])
+        return record["value"]
+
+    def set(self, key, value, ttl: float):
+        """Store value under key for ttl seconds (atomic replace on disk)."""
+        digest = self._digest(key)
+        expires = time.time() + ttl
+        with self._lock:
+            self._memory[digest] = (expires, value)
+
+        path = os.path.join(self.directory, digest)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(dumps_compact({"expires": expires, "value": value}))
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.debug("Could not write cache entry %s", digest)
+
+    def get_or_fetch(
+        self, key, fetch: Callable[[], object], ttl: float, empty_ttl: Optional[float] = None
+    ):
+        """
+        Return the cached value for key, calling fetch() and caching it on a
+        miss. An empty result (e.g. a search with no hits) is kept for
+        empty_ttl instead, when given, so it's retried sooner.
+        """
+        value = self.get(key)
+        if value is None:
+            value = fetch()
+            self.set(key, value, ttl if value or empty_ttl is None else empty_ttl)
+        return value
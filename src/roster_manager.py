@@ -6,90 +6,192 @@ filters to Pro/NCAA levels, and normalizes column names.
 """
 
 import csv
+import hashlib
 import io
 import logging
-from typing import Optional
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from operator import itemgetter
+from typing import Iterator, Optional, TextIO
 
 import requests
 
-from .config import COLUMN_MAP, INCLUDED_LEVELS, RECRUITS_URL, ROSTER_URL
+from .config import COLUMN_MAP, INCLUDED_LEVELS, RECRUITS_URL, ROSTER_CACHE_DIR, ROSTER_URL
+from .http_session import SESSION
+from .jsonio import dumps_compact, read_json
 
 logger = logging.getLogger(__name__)
 
+# Frozen once at import: the per-row Level test is then a plain set probe
+_INCLUDED_LEVELS = frozenset(INCLUDED_LEVELS)
+
 
 def fetch_roster(url: Optional[str] = None) -> list[dict]:
     """
-    Download the Google Sheet CSV and return rows as a list of raw dicts
-    (keyed by the original Sheet column headers).
+    Download the Google Sheet CSV and return its Pro/NCAA players as
+    normalized dicts (see parse_roster).
     """
     url = url or ROSTER_URL
     logger.info("Fetching roster from %s", url)
 
     try:
-        resp = requests.get(url, timeout=30)
-        resp.raise_for_status()
+        with _open_sheet(url) as lines:
+            return parse_roster(csv.reader(lines))
     except requests.RequestException as exc:
         logger.error("Failed to fetch roster: %s", exc)
         raise
 
-    reader = csv.DictReader(io.StringIO(resp.text))
 
-    # Validate that expected columns exist
-    if reader.fieldnames is None:
+def parse_roster(reader: Iterator[list[str]]) -> list[dict]:
+    """
+    Turn CSV rows (header row first) into normalized player dicts, keeping
+    only players whose Level is in INCLUDED_LEVELS (Pro, NCAA).
+
+    Sheet columns are mapped to internal keys via COLUMN_MAP; their
+    positions are looked up once from the header, and rows at other levels
+    are dropped before any dict is built for them. Each kept row's mapped
+    cells are then pulled and stripped column-wise in C (itemgetter + map)
+    rather than one Python-level lookup per cell.
+    """
+    headers = next(reader, None)
+    if headers is None:
         raise ValueError("CSV has no headers")
 
-    missing = [col for col in COLUMN_MAP if col not in reader.fieldnames]
+    # Validate that expected columns exist
+    position = {col: i for i, col in enumerate(headers)}
+    missing = [col for col in COLUMN_MAP if col not in position]
     if missing:
         logger.warning("Missing expected columns in sheet: %s", missing)
 
-    rows = list(reader)
-    logger.info("Fetched %d rows from roster", len(rows))
-    return rows
+    # A missing column reads the blank cell appended to every kept row just
+    # past the header's width, so it comes out as "" without a per-cell check
+    pad = len(headers)
+    level_idx = position.get("Level", sys.maxsize)
+    keys = tuple(COLUMN_MAP.values())
+    cells = itemgetter(*(position.get(col, pad) for col in COLUMN_MAP))
+    strip = str.strip
+
+    players = []
+    total = 0
+    for row in reader:
+        total += 1
+        width = len(row)
+        level = row[level_idx] if level_idx < width else ""
+        if not level or strip(level) not in _INCLUDED_LEVELS:
+            continue
 
+        if width < pad:
+            row += [""] * (pad - width)
+        elif width > pad:
+            del row[pad:]
+        row.append("")
+        player = dict(zip(keys, map(strip, cells(row))))
+        # Coerce roster_priority to int (default 99 if missing/invalid)
+        try:
+            player["roster_priority"] = int(player["roster_priority"])
+        except (ValueError, TypeError):
+            player["roster_priority"] = 99
+        players.append(player)
 
-def normalize_player(raw: dict) -> dict:
-    """
-    Map sheet column names to internal keys using COLUMN_MAP.
-    Coerce roster_priority to int.
-    """
-    player = {}
-    for sheet_col, internal_key in COLUMN_MAP.items():
-        player[internal_key] = raw.get(sheet_col, "").strip()
+    logger.info(
+        "Fetched %d rows from roster: %d players (kept Pro/NCAA, dropped HS)",
+        total,
+        len(players),
+    )
+    return players
 
-    # Coerce roster_priority to int (default 99 if missing/invalid)
-    try:
-        player["roster_priority"] = int(player["roster_priority"])
-    except (ValueError, TypeError):
-        player["roster_priority"] = 99
 
-    return player
+class _TeeReader(io.RawIOBase):
+    """Raw byte stream that copies everything read from src into sink."""
 
+    def __init__(self, src, sink):
+        self._src = src
+        self._sink = sink
 
-def filter_roster(rows: list[dict]) -> list[dict]:
-    """
-    Keep only players whose Level is in INCLUDED_LEVELS (Pro, NCAA).
-    Returns normalized player dicts.
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n = self._src.readinto(buffer)
+        if n:
+            self._sink.write(memoryview(buffer)[:n])
+        return n
+
+
+@contextmanager
+def _open_sheet(url: str) -> Iterator[TextIO]:
     """
-    filtered = []
-    for raw in rows:
-        level = raw.get("Level", "").strip()
-        if level not in INCLUDED_LEVELS:
-            continue
-        filtered.append(normalize_player(raw))
+    Open a published sheet's CSV as text for parsing.
 
-    logger.info(
-        "Filtered roster: %d players (kept Pro/NCAA, dropped HS)", len(filtered)
-    )
-    return filtered
+    A copy of each download is kept on disk with its ETag/Last-Modified,
+    which are sent back next time: an unchanged sheet answers 304 with no
+    body and the copy is read instead. A changed sheet is parsed straight
+    off the socket while the same bytes are written to the new copy.
+    """
+    base = os.path.join(ROSTER_CACHE_DIR, hashlib.sha1(url.encode()).hexdigest())
+    csv_path, meta_path = base + ".csv", base + ".meta.json"
+
+    headers = {}
+    if os.path.exists(csv_path) and os.path.exists(meta_path):
+        try:
+            meta = read_json(meta_path)
+        except Exception:
+            logger.debug("Unreadable roster cache metadata for %s — ignoring", url)
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    with SESSION.get(url, headers=headers, timeout=30, stream=True) as resp:
+        if resp.status_code == 304 and headers:
+            logger.info("Sheet unchanged since last fetch — using cached copy")
+            with open(csv_path, encoding="utf-8-sig", newline="") as lines:
+                yield lines
+            return
+        resp.raise_for_status()
+        logger.debug(
+            "Sheet response Content-Encoding: %s", resp.headers.get("Content-Encoding", "identity")
+        )
+
+        os.makedirs(ROSTER_CACHE_DIR, exist_ok=True)
+        # Drop the old validators first, so a download that dies partway
+        # leads to a plain GET next time rather than a 304 for the wrong body
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+        resp.raw.decode_content = True  # undo gzip transfer encoding on the fly
+        resp.raw.auto_close = False  # let TextIOWrapper read through to EOF
+        fd, tmp_path = tempfile.mkstemp(dir=ROSTER_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as sink:
+                tee = io.BufferedReader(_TeeReader(resp.raw, sink))
+                yield io.TextIOWrapper(tee, encoding="utf-8-sig", newline="")
+                # Copy anything the parser left unread, so the saved copy is whole
+                while tee.read(64 * 1024):
+                    pass
+            os.replace(tmp_path, csv_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        meta = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+    with open(meta_path, "wb") as f:
+        f.write(dumps_compact(meta))
 
 
 def get_active_roster(url: Optional[str] = None) -> list[dict]:
     """
-    Convenience wrapper: fetch + filter in one call.
+    Fetch the client roster.
     Returns clients (is_client=True).
     """
-    raw_rows = fetch_roster(url)
-    players = filter_roster(raw_rows)
+    players = fetch_roster(url)
     for p in players:
         p["is_client"] = True
     return players
@@ -102,8 +204,7 @@ def get_recruits(url: Optional[str] = None) -> list[dict]:
     """
     url = url or RECRUITS_URL
     try:
-        raw_rows = fetch_roster(url)
-        players = filter_roster(raw_rows)
+        players = fetch_roster(url)
         for p in players:
             p["is_client"] = False
         logger.info("Fetched %d recruits", len(players))
@@ -115,8 +216,12 @@ def get_recruits(url: Optional[str] = None) -> list[dict]:
 
 def get_all_players() -> list[dict]:
     """
-    Fetch both clients and recruits, combined.
+    Fetch both clients and recruits, combined. The two sheets download
+    side by side (over the shared session's pool) rather than one after
+    the other.
     """
-    clients = get_active_roster()
-    recruits = get_recruits()
-    return clients + recruits
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        # Recruits on a worker, clients on this thread
+        recruits_future = ex.submit(get_recruits)
+        clients = get_active_roster()
+        return clients + recruits_future.result()
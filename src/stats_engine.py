@@ -9,49 +9,162 @@ Two ecosystems:
 from __future__ import annotations
 
 import abc
+import html
 import logging
-from datetime import date, datetime, timedelta, timezone
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Optional
+from zoneinfo import ZoneInfo
 
 import requests
 import statsapi
-from bs4 import BeautifulSoup
-
-from .config import ROSTER_URL
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+
+from .config import (
+    FETCH_WORKERS,
+    PLAYER_ID_CACHE_PATH,
+    ROSTER_URL,
+    SCRAPER_WORKERS,
+    STATSAPI_CACHE_TTL_LOOKUP,
+    STATSAPI_CACHE_TTL_LOOKUP_MISS,
+)
+from .http_session import SESSION, throttled_get
+from .jsonio import dumps_compact, read_json, write_atomic
+from .response_cache import ResponseCache
 
 logger = logging.getLogger(__name__)
 
 
 # ===== Shared data structures =====
 
+# Built once; empty_stats() hands out copies. dict.copy() of an all-string-key
+# dict clones the hash table directly instead of inserting 23 keys one by one.
+_EMPTY_STATS = {
+    "stats_summary": "No game data",
+    "game_context": "",
+    "game_status": "N/A",
+    "game_time": None,  # Scheduled start time (e.g., "7:05 PM ET")
+    "next_game": None,  # Dict with date, opponent, time for next game
+    "is_pitcher_line": False,
+    # Raw fields used by the analyzer
+    "hits": 0,
+    "at_bats": 0,
+    "home_runs": 0,
+    "rbi": 0,
+    "runs": 0,
+    "stolen_bases": 0,
+    "ip": 0.0,
+    "earned_runs": 0,
+    "strikeouts": 0,
+    "walks_allowed": 0,
+    "hits_allowed": 0,
+    "saves": 0,
+    "win": False,
+    "loss": False,
+    "quality_start": False,
+    "is_debut": False,
+    "milestone_label": None,
+}
+
+
 def empty_stats() -> dict:
     """Return a blank stats dict (no data available)."""
-    return {
-        "stats_summary": "No game data",
-        "game_context": "",
-        "game_status": "N/A",
-        "game_time": None,  # Scheduled start time (e.g., "7:05 PM ET")
-        "next_game": None,  # Dict with date, opponent, time for next game
-        "is_pitcher_line": False,
-        # Raw fields used by the analyzer
-        "hits": 0,
-        "at_bats": 0,
-        "home_runs": 0,
-        "rbi": 0,
-        "runs": 0,
-        "stolen_bases": 0,
-        "ip": 0.0,
-        "earned_runs": 0,
-        "strikeouts": 0,
-        "walks_allowed": 0,
-        "hits_allowed": 0,
-        "saves": 0,
-        "win": False,
-        "loss": False,
-        "quality_start": False,
-        "is_debut": False,
-        "milestone_label": None,
-    }
+    return _EMPTY_STATS.copy()
+
+
+# Game times are shown in Eastern; the zone handles the EST/EDT switch
+_EASTERN = ZoneInfo("America/New_York")
+
+
+@lru_cache(maxsize=1024)
+def _format_et_time(iso_str: str) -> str:
+    """
+    Format an ISO UTC timestamp ("2026-04-01T23:05:00Z") as an Eastern
+    clock time like "7:05 PM ET", or "" if it's missing or unparseable.
+    Cached: teammates and opponents share their game's start time.
+    """
+    if not iso_str:
+        return ""
+    try:
+        dt = datetime.fromisoformat(iso_str.replace("Z", "+00:00"))
+        return dt.astimezone(_EASTERN).strftime("%-I:%M %p ET")
+    except Exception:
+        return ""
+
+
+def _int(d: dict, key: str) -> int:
+    """d[key] as an int, with a missing, empty or None value counting as 0."""
+    value = d.get(key)
+    return int(value) if value else 0
+
+
+def _batting_summary(h: int, ab: int, hr: int, rbi: int, r: int, sb: int, bb: int = 0) -> str:
+    """Box score line like "2-4, HR, 3 RBI"; zero counts are left out."""
+    parts = [f"{h}-{ab}"]
+    append = parts.append
+    if hr:
+        append(f"{hr} HR" if hr > 1 else "HR")
+    if rbi:
+        append(f"{rbi} RBI")
+    if r:
+        append(f"{r} R")
+    if sb:
+        append(f"{sb} SB")
+    if bb:
+        append(f"{bb} BB")
+    return ", ".join(parts)
+
+
+def _pitching_summary(
+    ip_str: str, ha: int, er: int, k: int, bb: int, sv=0, w=0, l=0
+) -> str:
+    """Box score line like "6.0 IP, 4 H, 1 ER, 7 K, W"; H and BB only when nonzero."""
+    parts = [f"{ip_str} IP", f"{ha} H"] if ha else [f"{ip_str} IP"]
+    append = parts.append
+    append(f"{er} ER")
+    append(f"{k} K")
+    if bb:
+        append(f"{bb} BB")
+    if sv:
+        append("SV")
+    if w:
+        append("W")
+    if l:
+        append("L")
+    return ", ".join(parts)
+
+
+class _Memo:
+    """
+    Per-run memo shared by worker threads: get(key, loader) returns the
+    cached value, calling loader() on first use. Concurrent callers asking
+    for the same key wait for the one in-flight load instead of starting
+    their own; a loader that raises caches nothing.
+    """
+
+    def __init__(self):
+        self._values: dict = {}
+        self._key_locks: dict = {}
+        self._guard = threading.Lock()
+
+    def get(self, key, loader):
+        if key in self._values:
+            return self._values[key]
+        with self._guard:
+            lock = self._key_locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._values:
+                self._values[key] = loader()
+            return self._values[key]
+
+    def clear(self):
+        """Forget every cached value (loads already in flight still finish)."""
+        with self._guard:
+            self._values.clear()
+            self._key_locks.clear()
 
 
 # =========================================================================
@@ -64,18 +177,148 @@ TEAM_NAME_MAP = {
     "Unsigned": None,
 }
 
+STATSAPI_URL = "https://statsapi.mlb.com/api/v1"
+
+
+def _statsapi_get(path: str, params: dict) -> dict:
+    """GET a StatsAPI endpoint over the shared session and decode its JSON."""
+    resp = SESSION.get(f"{STATSAPI_URL}/{path}", params=params, timeout=15)
+    resp.raise_for_status()
+    return resp.json()
+
+
+def _fetch_schedule(date_str: str) -> list[dict]:
+    """
+    A day's MLB games as flat records, with the keys statsapi.schedule()
+    used (game_id, status, home_name, away_score, current_inning, ...).
+    """
+    data = _statsapi_get("schedule", {
+        "sportId": 1, "date": date_str, "hydrate": "linescore",
+    })
+    games = []
+    for day in data.get("dates", []):
+        for game in day.get("games", []):
+            away, home = game["teams"]["away"], game["teams"]["home"]
+            linescore = game.get("linescore", {})
+            games.append({
+                "game_id": game["gamePk"],
+                "game_datetime": game.get("gameDate", ""),
+                "game_date": day.get("date", ""),
+                "status": game.get("status", {}).get("detailedState", "Unknown"),
+                "away_name": away["team"].get("name", "???"),
+                "home_name": home["team"].get("name", "???"),
+                "away_score": away.get("score", 0),
+                "home_score": home.get("score", 0),
+                "current_inning": linescore.get("currentInning", ""),
+                "inning_state": linescore.get("inningState", ""),
+            })
+    return games
+
+
+def _fetch_boxscore(game_id: int) -> dict:
+    """A game's raw boxscore: teams.{home,away} with batters, pitchers and players."""
+    return _statsapi_get(f"game/{game_id}/boxscore", {})
+
+
+def _name_key(name: str) -> str:
+    """Case- and whitespace-insensitive key for matching player names."""
+    return " ".join(name.casefold().split())
+
+
+# Game-state formatters for _extract_stats, keyed by statsapi status. Each
+# returns (game_context, game_status, stats_summary or None to keep the default).
+def _final_context(sched: dict, status: str, away: str, home: str, game_time: Optional[str]):
+    score = f"{away} {sched.get('away_score', 0)}, {home} {sched.get('home_score', 0)}"
+    return f"{score} | Final", "Final", None
+
+
+def _live_context(sched: dict, status: str, away: str, home: str, game_time: Optional[str]):
+    score = f"{away} {sched.get('away_score', 0)}, {home} {sched.get('home_score', 0)}"
+    half = sched.get("inning_state", "")
+    return f"{score} | {half} {sched.get('current_inning', '')}", "Live", None
+
+
+def _scheduled_context(sched: dict, status: str, away: str, home: str, game_time: Optional[str]):
+    # Game hasn't started yet - show scheduled time
+    if game_time:
+        return f"{away} vs {home} | {game_time}", "Scheduled", f"Game at {game_time}"
+    return f"{away} vs {home}", "Scheduled", "Game today"
+
+
+def _other_context(sched: dict, status: str, away: str, home: str, game_time: Optional[str]):
+    return f"{away} vs {home} | {status}", status, None
+
+
+_STATUS_CONTEXT = {
+    "Final": _final_context,
+    "In Progress": _live_context,
+    "Live": _live_context,
+    "Scheduled": _scheduled_context,
+    "Pre-Game": _scheduled_context,
+    "Warmup": _scheduled_context,
+}
+
 
 class ProStatsFetcher:
     """Fetch game/stats data for MLB and MiLB players via MLB-StatsAPI."""
 
-    def __init__(self):
-        self._games_cache: dict[str, list] = {}
+    def __init__(self, player_cache_path: str = PLAYER_ID_CACHE_PATH):
+        # Per-run response caches shared by every player on the fetcher, so
+        # teammates in the same game reuse one schedule/boxscore request.
+        self._games_cache = _Memo()  # "MM/DD/YYYY" -> schedule
+        self._boxscore_cache = _Memo()  # game_id -> boxscore
+        # "MM/DD/YYYY" -> ({player_id: game}, {name key: player_id})
+        self._day_index_cache = _Memo()
+        # today "MM/DD/YYYY" -> [(date, [(game, home lower, away lower)])]
+        # for the next 7 days
+        self._upcoming_cache = _Memo()
+        # name -> player_id, shared on disk with the historical fetcher
+        self.player_cache_path = player_cache_path
         self._player_cache: dict[str, int] = {}
-        self._today = date.today()
-        self._today_str = self._today.strftime("%m/%d/%Y")
+        self._player_cache_dirty = False  # new ids since the last save
+        self._load_player_cache()
+        # Search results (including "no match") for names not in the id map
+        self._response_cache = ResponseCache()
+        self._day_lock = threading.Lock()  # guards the midnight rollover
+        # (date, "MM/DD/YYYY") as one tuple so readers never see a torn pair
+        today = date.today()
+        self._day = (today, today.strftime("%m/%d/%Y"))
 
     # ----- public API -----
 
+    @property
+    def today(self) -> date:
+        return self._current_day()[0]
+
+    @property
+    def today_str(self) -> str:
+        """Today as the "MM/DD/YYYY" key the schedule caches use."""
+        return self._current_day()[1]
+
+    def prefetch(self):
+        """
+        Load today's schedule and boxscores ahead of the first fetch(), e.g.
+        while the roster is still downloading. Players fetched meanwhile just
+        wait for it instead of starting their own requests.
+        """
+        try:
+            self._get_day_index(self.today_str)
+        except Exception:
+            logger.exception("Prefetching today's MLB games failed")
+        try:
+            self._get_upcoming()
+        except Exception:
+            logger.exception("Prefetching the upcoming MLB schedule failed")
+
+    def save_player_cache(self):
+        """Write the name -> id map to disk if any lookups added to it."""
+        if self._player_cache_dirty:
+            try:
+                write_atomic(self.player_cache_path, dumps_compact(self._player_cache))
+                self._player_cache_dirty = False
+            except OSError:
+                logger.exception("Failed to save MLB player id cache")
+
     def fetch(self, player: dict) -> dict:
         """
         Given a normalized player dict, attempt to find today's game
@@ -115,185 +358,261 @@ class ProStatsFetcher:
 
     # ----- internal helpers -----
 
+    def _load_player_cache(self):
+        """Load name -> id mappings saved by earlier runs."""
+        if os.path.exists(self.player_cache_path):
+            try:
+                self._player_cache = read_json(self.player_cache_path)
+            except Exception:
+                logger.exception("Failed to load MLB player id cache")
+                self._player_cache = {}
+
     def _lookup_player(self, name: str) -> Optional[int]:
-        """Search MLB for a player ID by name, with caching."""
+        """Search MLB for a player ID by name, with caching (in memory and on disk)."""
         if name in self._player_cache:
             return self._player_cache[name]
 
+        # Anyone in today's games is already in the prefetched boxscores;
+        # only players not playing today need the search endpoint. A name
+        # match there is never written to the on-disk map (only ids found
+        # by lookup_player are), so a namesake mix-up lasts one run at most.
+        player_id = self._todays_player_id(name)
+        if player_id is not None:
+            return player_id
+
         try:
-            results = statsapi.lookup_player(name)
+            # Same cache key as the historical fetcher, so either mode's
+            # search serves the other
+            results = self._response_cache.get_or_fetch(
+                ("lookup_player", name),
+                lambda: statsapi.lookup_player(name),
+                STATSAPI_CACHE_TTL_LOOKUP,
+                empty_ttl=STATSAPI_CACHE_TTL_LOOKUP_MISS,
+            )
             if results:
                 player_id = results[0]["id"]
                 self._player_cache[name] = player_id
+                self._player_cache_dirty = True
                 return player_id
         except Exception:
             logger.exception("MLB player lookup failed for %s", name)
         return None
 
-    def _find_todays_game(self, player_id: int) -> Optional[dict]:
-        """Find a game today that involves the player's team."""
+    def _todays_player_id(self, name: str) -> Optional[int]:
+        """Player id for a name found in today's boxscores, if exactly one matches."""
         try:
-            schedule = statsapi.schedule(date=self._today_str)
-            # Check if the player is in any of today's games
-            for game in schedule:
-                boxscore = statsapi.boxscore_data(game["game_id"])
-                # Search both teams' rosters
-                for side in ("home", "away"):
-                    players = boxscore.get(f"{side}Batters", []) + boxscore.get(
-                        f"{side}Pitchers", []
-                    )
-                    if player_id in players:
-                        return {
+            return self._get_day_index(self.today_str)[1].get(_name_key(name))
+        except Exception:
+            logger.debug("Today's games unavailable for name lookup of %s", name)
+            return None
+
+    def _current_day(self) -> tuple[date, str]:
+        """
+        Today's date and key, re-read on each use so a run that crosses
+        midnight (late West Coast games) moves on to the new day. The
+        rollover drops every cached schedule and boxscore: what was fetched
+        as tomorrow's schedule is now today's, and its game states are stale.
+        """
+        today = date.today()
+        if today != self._day[0]:
+            with self._day_lock:
+                if today != self._day[0]:
+                    self._games_cache.clear()
+                    self._boxscore_cache.clear()
+                    self._day_index_cache.clear()
+                    self._upcoming_cache.clear()
+                    self._day = (today, today.strftime("%m/%d/%Y"))
+        return self._day
+
+    def _get_schedule(self, date_str: str) -> list:
+        return self._games_cache.get(date_str, lambda: _fetch_schedule(date_str))
+
+    def _get_boxscore(self, game_id: int) -> dict:
+        return self._boxscore_cache.get(game_id, lambda: _fetch_boxscore(game_id))
+
+    def _get_day_index(self, date_str: str) -> tuple[dict[int, dict], dict[str, Optional[int]]]:
+        return self._day_index_cache.get(date_str, lambda: self._build_day_index(date_str))
+
+    def _build_day_index(self, date_str: str) -> tuple[dict[int, dict], dict[str, Optional[int]]]:
+        """
+        Index a day's boxscores: player id -> game record for everyone who
+        appears in a game, and name key -> player id for everyone on the
+        game rosters (None where two players share a name).
+        All of the day's boxscores are fetched concurrently, once, instead of
+        each player walking the schedule one boxscore request at a time.
+        """
+        schedule = self._get_schedule(date_str)
+
+        def load(game: dict) -> Optional[dict]:
+            try:
+                return self._get_boxscore(game["game_id"])
+            except Exception:
+                logger.exception("Failed to fetch boxscore for game %s", game.get("game_id"))
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(schedule) or 1)) as ex:
+            boxscores = list(ex.map(load, schedule))
+
+        index: dict[int, dict] = {}
+        names: dict[str, Optional[int]] = {}
+        for game, boxscore in zip(schedule, boxscores):
+            if boxscore is None:
+                continue
+            for side in ("home", "away"):
+                # The side's per-player game entries (whole game roster),
+                # keyed "ID<personId>"
+                team = boxscore.get("teams", {}).get(side, {})
+                players = team.get("players", {})
+                for entry in players.values():
+                    person = entry.get("person", {})
+                    pid, full_name = person.get("id"), person.get("fullName")
+                    if pid and full_name:
+                        key = _name_key(full_name)
+                        # An ambiguous name maps to None, leaving it to lookup_player
+                        names[key] = pid if names.get(key, pid) == pid else None
+                # Batters who took a lineup spot (bench players are listed
+                # too, without a battingOrder), then every pitcher used
+                batters = [
+                    pid for pid in team.get("batters", [])
+                    if players.get(f"ID{pid}", {}).get("battingOrder")
+                ]
+                for role, group, ids in (
+                    ("Batters", "batting", batters),
+                    ("Pitchers", "pitching", team.get("pitchers", [])),
+                ):
+                    for pid in ids:
+                        # First game/side wins, matching schedule order
+                        record = index.setdefault(pid, {
                             "game_id": game["game_id"],
                             "boxscore": boxscore,
                             "schedule": game,
                             "side": side,
-                        }
+                            # "Batters"/"Pitchers" -> the player's batting/pitching stats
+                            "lines": {},
+                        })
+                        if record["boxscore"] is boxscore and record["side"] == side:
+                            stats = players.get(f"ID{pid}", {}).get("stats", {}).get(group)
+                            if stats:
+                                record["lines"].setdefault(role, stats)
+        return index, names
+
+    def _find_todays_game(self, player_id: int) -> Optional[dict]:
+        """Find a game today that involves the player's team."""
+        try:
+            return self._get_day_index(self.today_str)[0].get(player_id)
         except Exception:
             logger.exception("Error searching today's games for player %d", player_id)
         return None
 
+    def _get_upcoming(self) -> list[tuple[date, list[tuple[dict, str, str]]]]:
+        today, today_str = self._current_day()
+        return self._upcoming_cache.get(today_str, lambda: self._load_upcoming(today))
+
+    def _load_upcoming(self, today: date) -> list[tuple[date, list[tuple[dict, str, str]]]]:
+        """
+        The next 7 days' schedules, in date order. All 7 are requested at
+        once rather than one round trip after another, and each game's team
+        names are lowercased here once for every player's team match.
+        """
+        days = [today + timedelta(days=days_ahead) for days_ahead in range(1, 8)]
+        with ThreadPoolExecutor(max_workers=len(days)) as ex:
+            schedules = list(ex.map(
+                lambda day: self._get_schedule(day.strftime("%m/%d/%Y")), days
+            ))
+        return [
+            (day, [
+                (game, game.get("home_name", "").lower(), game.get("away_name", "").lower())
+                for game in schedule
+            ])
+            for day, schedule in zip(days, schedules)
+        ]
+
     def _find_next_game(self, player_id: int, team: str) -> Optional[dict]:
         """Find the next scheduled game for a player's team."""
         try:
-            # Look ahead up to 7 days
-            for days_ahead in range(1, 8):
-                future_date = self._today + timedelta(days=days_ahead)
-                future_str = future_date.strftime("%m/%d/%Y")
-
-                schedule = statsapi.schedule(date=future_str)
-                for game in schedule:
-                    # Check if this team is playing
-                    home = game.get("home_name", "")
-                    away = game.get("away_name", "")
-
-                    # Match team name (partial match for flexibility)
-                    team_lower = team.lower()
-                    if team_lower in home.lower() or team_lower in away.lower():
-                        # Determine opponent
-                        if team_lower in home.lower():
-                            opponent = away
-                            home_away = "vs"
-                        else:
-                            opponent = home
-                            home_away = "@"
+            # Match team name (partial match for flexibility)
+            team_lower = team.lower()
+
+            # Look ahead up to 7 days; earliest match wins
+            for future_date, schedule in self._get_upcoming():
+                for game, home_lower, away_lower in schedule:
+                    # Check if this team is playing, and determine opponent
+                    if team_lower in home_lower:
+                        opponent = game.get("away_name", "")
+                        home_away = "vs"
+                    elif team_lower in away_lower:
+                        opponent = game.get("home_name", "")
+                        home_away = "@"
+                    else:
+                        continue
 
-                        # Parse game time
-                        game_time = self._format_game_time(game.get("game_datetime", ""))
+                    # Parse game time
+                    game_time = _format_et_time(game.get("game_datetime", ""))
 
-                        return {
-                            "date": future_date.strftime("%a %m/%d"),
-                            "date_full": future_date.isoformat(),
-                            "opponent": opponent,
-                            "home_away": home_away,
-                            "time": game_time,
-                            "display": f"{home_away} {opponent} - {future_date.strftime('%a %m/%d')} {game_time}" if game_time else f"{home_away} {opponent} - {future_date.strftime('%a %m/%d')}",
-                        }
+                    return {
+                        "date": future_date.strftime("%a %m/%d"),
+                        "date_full": future_date.isoformat(),
+                        "opponent": opponent,
+                        "home_away": home_away,
+                        "time": game_time,
+                        "display": f"{home_away} {opponent} - {future_date.strftime('%a %m/%d')} {game_time}" if game_time else f"{home_away} {opponent} - {future_date.strftime('%a %m/%d')}",
+                    }
 
             return None
         except Exception:
             logger.debug("Error finding next game for %s", team)
             return None
 
-    @staticmethod
-    def _format_game_time(game_datetime_str: str) -> str:
-        """Format game datetime string to readable time (e.g., '7:05 PM ET')."""
-        if not game_datetime_str:
-            return ""
-        try:
-            # MLB API returns ISO format like "2026-04-01T23:05:00Z"
-            dt = datetime.fromisoformat(game_datetime_str.replace("Z", "+00:00"))
-            # Convert to ET (UTC-4 or UTC-5 depending on DST, approximate with -4)
-            from datetime import timezone
-            et_offset = timezone(timedelta(hours=-4))
-            dt_et = dt.astimezone(et_offset)
-            return dt_et.strftime("%-I:%M %p ET").replace(" 0", " ")
-        except Exception:
-            return ""
-
     def _extract_stats(self, player: dict, player_id: int, game: dict) -> dict:
         """Pull the player's line from the boxscore."""
         result = empty_stats()
         sched = game["schedule"]
-        box = game["boxscore"]
 
         # Game context
         status = sched.get("status", "Unknown")
         home = sched.get("home_name", "")
         away = sched.get("away_name", "")
-        home_score = sched.get("home_score", 0)
-        away_score = sched.get("away_score", 0)
-        inning = sched.get("current_inning", "")
 
         # Get scheduled game time
-        game_time = self._format_game_time(sched.get("game_datetime", ""))
+        game_time = _format_et_time(sched.get("game_datetime", ""))
         result["game_time"] = game_time
 
-        if status == "Final":
-            result["game_context"] = f"{away} {away_score}, {home} {home_score} | Final"
-            result["game_status"] = "Final"
-        elif status in ("In Progress", "Live"):
-            half = sched.get("inning_state", "")
-            result["game_context"] = (
-                f"{away} {away_score}, {home} {home_score} | {half} {inning}"
-            )
-            result["game_status"] = "Live"
-        elif status in ("Scheduled", "Pre-Game", "Warmup"):
-            # Game hasn't started yet - show scheduled time
-            result["game_context"] = f"{away} vs {home} | {game_time}" if game_time else f"{away} vs {home}"
-            result["game_status"] = "Scheduled"
-            result["stats_summary"] = f"Game at {game_time}" if game_time else "Game today"
-        else:
-            result["game_context"] = f"{away} vs {home} | {status}"
-            result["game_status"] = status
+        context = _STATUS_CONTEXT.get(status, _other_context)
+        result["game_context"], result["game_status"], summary = context(
+            sched, status, away, home, game_time
+        )
+        if summary is not None:
+            result["stats_summary"] = summary
 
-        # Find the player's stats line in the boxscore
-        pid_str = f"ID{player_id}"
+        # The player's stats were picked out of the boxscore by id when
+        # today's games were indexed
+        lines = game.get("lines", {})
         position = player.get("position", "Hitter")
 
         if position == "Pitcher":
             result["is_pitcher_line"] = True
-            pitchers = box.get(f"{game['side']}Pitchers", [])
-            for entry in pitchers:
-                if isinstance(entry, dict) and str(player_id) in str(
-                    entry.get("personId", "")
-                ):
-                    result.update(self._parse_pitcher_line(entry))
-                    break
+            stats = lines.get("Pitchers")
+            if stats is not None:
+                result.update(self._parse_pitcher_line(stats))
         else:
-            batters = box.get(f"{game['side']}Batters", [])
-            for entry in batters:
-                if isinstance(entry, dict) and str(player_id) in str(
-                    entry.get("personId", "")
-                ):
-                    result.update(self._parse_batter_line(entry))
-                    break
+            stats = lines.get("Batters")
+            if stats is not None:
+                result.update(self._parse_batter_line(stats))
 
         return result
 
     @staticmethod
-    def _parse_batter_line(entry: dict) -> dict:
-        """Parse a batter's boxscore entry into our stats dict."""
-        stats = entry.get("stats", {})
-        h = int(stats.get("hits", 0))
-        ab = int(stats.get("atBats", 0))
-        hr = int(stats.get("homeRuns", 0))
-        rbi = int(stats.get("rbi", 0))
-        r = int(stats.get("runs", 0))
-        sb = int(stats.get("stolenBases", 0))
-
-        parts = [f"{h}-{ab}"]
-        if hr:
-            parts.append(f"{hr} HR" if hr > 1 else "HR")
-        if rbi:
-            parts.append(f"{rbi} RBI")
-        if r:
-            parts.append(f"{r} R")
-        if sb:
-            parts.append(f"{sb} SB")
+    def _parse_batter_line(stats: dict) -> dict:
+        """Parse a batter's boxscore batting stats into our stats dict."""
+        h = _int(stats, "hits")
+        ab = _int(stats, "atBats")
+        hr = _int(stats, "homeRuns")
+        rbi = _int(stats, "rbi")
+        r = _int(stats, "runs")
+        sb = _int(stats, "stolenBases")
 
         return {
-            "stats_summary": ", ".join(parts),
+            "stats_summary": _batting_summary(h, ab, hr, rbi, r, sb),
             "hits": h,
             "at_bats": ab,
             "home_runs": hr,
@@ -303,37 +622,22 @@ class ProStatsFetcher:
         }
 
     @staticmethod
-    def _parse_pitcher_line(entry: dict) -> dict:
-        """Parse a pitcher's boxscore entry into our stats dict."""
-        stats = entry.get("stats", {})
+    def _parse_pitcher_line(stats: dict) -> dict:
+        """Parse a pitcher's boxscore pitching stats into our stats dict."""
         ip_str = stats.get("inningsPitched", "0")
         ip = float(ip_str) if ip_str else 0.0
-        er = int(stats.get("earnedRuns", 0))
-        k = int(stats.get("strikeOuts", 0))
-        bb = int(stats.get("baseOnBalls", 0))
-        ha = int(stats.get("hits", 0))
-        sv = int(stats.get("saves", 0))
+        er = _int(stats, "earnedRuns")
+        k = _int(stats, "strikeOuts")
+        bb = _int(stats, "baseOnBalls")
+        ha = _int(stats, "hits")
+        sv = _int(stats, "saves")
         w = stats.get("wins", 0)
         l = stats.get("losses", 0)
 
-        parts = [f"{ip_str} IP"]
-        if ha:
-            parts.append(f"{ha} H")
-        parts.append(f"{er} ER")
-        parts.append(f"{k} K")
-        if bb:
-            parts.append(f"{bb} BB")
-        if sv:
-            parts.append("SV")
-        if w:
-            parts.append("W")
-        if l:
-            parts.append("L")
-
         qs = ip >= 6.0 and er <= 3
 
         return {
-            "stats_summary": ", ".join(parts),
+            "stats_summary": _pitching_summary(ip_str, ha, er, k, bb, sv, w, l),
             "is_pitcher_line": True,
             "ip": ip,
             "earned_runs": er,
@@ -355,7 +659,8 @@ class ProStatsFetcher:
 class BaseSchoolScraper(abc.ABC):
     """
     Base class for school-specific NCAA stat scrapers.
-    Subclass this and register in SCHOOL_SCRAPERS to add support for a school.
+    Subclass this to add a new kind of source. Schools on a platform that
+    already has a parser only need a SCHOOL_FEEDS entry.
     """
 
     @abc.abstractmethod
@@ -367,91 +672,93 @@ class BaseSchoolScraper(abc.ABC):
         ...
 
 
-class SidearmScraper(BaseSchoolScraper):
-    """
-    Scraper for schools using the Sidearm Sports platform.
-    Many D1 programs use this (e.g., Florida, Texas, Alabama).
-    """
+# ----- Per-school stat feeds -----
+#
+# Schools whose stats live on a known platform feed, declared as data rather
+# than one scraper class per platform. Add a school here as you discover its
+# feed URL; "platform" picks the parser in _FEED_PARSERS.
+SCHOOL_FEEDS: dict[str, dict[str, str]] = {
+    # "Florida": {
+    #     "platform": "sidearm",
+    #     "url": "https://floridagators.com/sports/baseball/stats?format=json",
+    # },
+    # "Coastal Carolina": {
+    #     "platform": "statbroadcast",
+    #     "url": "https://statbroadcast.com/events/statmonitr.php?gid=ccu",
+    # },
+    # "Some School": {
+    #     "platform": "ncaa_org",
+    #     "url": "https://stats.ncaa.org/teams/...",
+    # },
+}
 
-    # Override per school — map school name to its Sidearm base URL
-    SIDEARM_URLS: dict[str, str] = {
-        # "Florida": "https://floridagators.com/sports/baseball/stats",
-        # Add URLs as you discover them
-    }
 
-    def fetch_stats(self, player_name: str, team: str) -> Optional[dict]:
-        base_url = self.SIDEARM_URLS.get(team)
-        if not base_url:
-            logger.debug("No Sidearm URL configured for %s", team)
-            return None
+def _parse_sidearm(player_name: str, resp: requests.Response) -> Optional[dict]:
+    """Sidearm Sports JSON stats feed (many Power 5 programs)."""
+    # Sidearm feed structures vary by school — this is a starting point
+    logger.debug("Sidearm feed parsing not yet implemented for this school")
+    return None
 
-        try:
-            # Sidearm exposes a JSON schedule/stats feed at predictable paths
-            resp = requests.get(f"{base_url}?format=json", timeout=15)
-            resp.raise_for_status()
-            data = resp.json()
-            return self._find_player_in_feed(player_name, data)
-        except Exception:
-            logger.info("Sidearm fetch failed for %s @ %s", player_name, team)
-            return None
 
-    def _find_player_in_feed(self, player_name: str, data: dict) -> Optional[dict]:
-        """Parse the Sidearm JSON feed for a specific player. Override as needed."""
-        # Sidearm feed structures vary — this is a starting point
-        logger.debug("Sidearm feed parsing not yet implemented for this school")
-        return None
+def _parse_statbroadcast(player_name: str, resp: requests.Response) -> Optional[dict]:
+    """StatBroadcast live stats page."""
+    logger.debug("StatBroadcast parsing not yet implemented")
+    return None
+
+
+def _parse_ncaa_org(player_name: str, resp: requests.Response) -> Optional[dict]:
+    """stats.ncaa.org team page (least reliable, widest coverage)."""
+    # stats.ncaa.org requires team lookup -> schedule -> boxscore
+    # This is a structural placeholder — the site changes frequently
+    logger.info("NCAA.org parsing for %s not yet fully implemented", player_name)
+    return None
+
+
+_FEED_PARSERS = {
+    "sidearm": _parse_sidearm,
+    "statbroadcast": _parse_statbroadcast,
+    "ncaa_org": _parse_ncaa_org,
+}
 
 
-class StatBroadcastScraper(BaseSchoolScraper):
+class FeedScraper(BaseSchoolScraper):
     """
-    Scraper for schools using the StatBroadcast live stats platform.
+    Scraper for the schools in SCHOOL_FEEDS: one dict lookup, one request,
+    and the platform's parser. Schools without a feed return None at once.
     """
 
-    STATBROADCAST_URLS: dict[str, str] = {
-        # "Coastal Carolina": "https://statbroadcast.com/events/statmonitr.php?gid=ccu",
-        # Add URLs as you discover them
-    }
+    def __init__(self, feeds: Optional[dict[str, dict[str, str]]] = None):
+        self.feeds = SCHOOL_FEEDS if feeds is None else feeds
 
     def fetch_stats(self, player_name: str, team: str) -> Optional[dict]:
-        url = self.STATBROADCAST_URLS.get(team)
-        if not url:
-            logger.debug("No StatBroadcast URL configured for %s", team)
+        feed = self.feeds.get(team)
+        if feed is None:
             return None
 
+        platform = feed["platform"]
         try:
-            resp = requests.get(url, timeout=15)
+            resp = throttled_get(feed["url"], timeout=15)
             resp.raise_for_status()
-            return self._parse_statbroadcast(player_name, resp.text)
+            return _FEED_PARSERS[platform](player_name, resp)
         except Exception:
-            logger.info("StatBroadcast fetch failed for %s @ %s", player_name, team)
+            logger.info("%s feed fetch failed for %s @ %s", platform, player_name, team)
             return None
 
-    def _parse_statbroadcast(self, player_name: str, html: str) -> Optional[dict]:
-        logger.debug("StatBroadcast parsing not yet implemented")
-        return None
 
+def _ancestor(node: LexborNode, tag: str) -> Optional[LexborNode]:
+    """Nearest enclosing element named tag, or None."""
+    node = node.parent
+    while node is not None and node.tag != tag:
+        node = node.parent
+    return node
 
-class NCAAOrgScraper(BaseSchoolScraper):
-    """
-    Fallback scraper: stats.ncaa.org box scores.
-    This is the least reliable but widest-coverage option.
-    """
 
-    BASE_URL = "https://stats.ncaa.org"
+_TEAM_PUNCT = str.maketrans("", "", "&'.")
 
-    def fetch_stats(self, player_name: str, team: str) -> Optional[dict]:
-        try:
-            # stats.ncaa.org requires team lookup -> schedule -> boxscore
-            # This is a structural placeholder — the site changes frequently
-            logger.info(
-                "NCAA.org scraper called for %s @ %s — not yet fully implemented",
-                player_name,
-                team,
-            )
-            return None
-        except Exception:
-            logger.info("NCAA.org fetch failed for %s @ %s", player_name, team)
-            return None
+
+def _team_key(team: str) -> str:
+    """Spelling-insensitive key for school names: "Texas A&amp;M " -> "texas am"."""
+    return " ".join(html.unescape(team).lower().translate(_TEAM_PUNCT).split())
 
 
 class D1BaseballScraper(BaseSchoolScraper):
@@ -463,6 +770,13 @@ class D1BaseballScraper(BaseSchoolScraper):
 
     BASE_URL = "https://d1baseball.com"
 
+    def __init__(self):
+        # Teammates and opponents share these within a run:
+        # (slug, date) -> today's box score URL or None
+        self._box_urls = _Memo()
+        # box score URL -> [(lowercased name cell, row cells, table headers)]
+        self._box_rows = _Memo()
+
     # Map school names to their D1Baseball team slug
     # Example: "Florida" -> "florida-gators"
     TEAM_SLUGS: dict[str, str] = {
@@ -512,51 +826,65 @@ class D1BaseballScraper(BaseSchoolScraper):
         "Wake Forest": "wake-forest-demon-deacons",
     }
 
+    # Other names the sheet or a scraped page may use for a TEAM_SLUGS school
+    TEAM_ALIASES: dict[str, str] = {
+        "Florida International": "FIU",
+        "Louisiana State": "LSU",
+        "Mississippi": "Ole Miss",
+        "Southeastern Louisiana": "SE Louisiana",
+        "Texas Christian": "TCU",
+    }
+
     def fetch_stats(self, player_name: str, team: str) -> Optional[dict]:
-        slug = self.TEAM_SLUGS.get(team)
+        slug = self.TEAM_SLUGS.get(team) or _SLUG_INDEX.get(_team_key(team))
         if not slug:
             logger.debug("No D1Baseball slug configured for %s", team)
             return None
 
         try:
-            # D1Baseball box scores are at /teams/{slug}/schedule
-            # We look for today's game and parse the box score
-            schedule_url = f"{self.BASE_URL}/teams/{slug}/schedule"
-            resp = requests.get(schedule_url, timeout=15)
-            resp.raise_for_status()
-
-            return self._find_player_box_score(player_name, team, resp.text)
-
+            box_url = self._box_urls.get(
+                (slug, date.today()), lambda: self._load_todays_box_url(slug, team)
+            )
         except Exception:
             logger.info("D1Baseball fetch failed for %s @ %s", player_name, team)
             return None
 
-    def _find_player_box_score(
-        self, player_name: str, team: str, html: str
-    ) -> Optional[dict]:
-        """
-        Parse D1Baseball schedule page to find today's game,
-        then fetch and parse the box score for the player.
-        """
+        if box_url is None:
+            return None
+        return self._parse_box_score(player_name, box_url)
+
+    def _load_todays_box_url(self, slug: str, team: str) -> Optional[str]:
+        """Download the team's schedule page and find today's box score link."""
+        # D1Baseball box scores are at /teams/{slug}/schedule
+        # We look for today's game and parse the box score
+        schedule_url = f"{self.BASE_URL}/teams/{slug}/schedule"
+        resp = throttled_get(schedule_url, timeout=15)
+        resp.raise_for_status()
+
+        return self._find_todays_box_url(team, resp.text)
+
+    def _find_todays_box_url(self, team: str, html: str) -> Optional[str]:
+        """Parse D1Baseball schedule page to find today's game's box score URL."""
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            tree = LexborHTMLParser(html)
 
             # Find links to box scores (typically contain "/boxscore/" in href)
             # D1Baseball uses format: /games/{game-slug}/boxscore
-            today_str = date.today().strftime("%m/%d")
+            today = date.today()
+            today_str = today.strftime("%m/%d")
+            today_abbr = today.strftime("%b %d")
 
             # Look for game rows with today's date
-            game_links = soup.select('a[href*="/boxscore"]')
+            game_links = tree.css('a[href*="/boxscore"]')
 
             for link in game_links:
                 # Check if this game is from today
-                row = link.find_parent("tr") or link.find_parent("div")
+                row = _ancestor(link, "tr") or _ancestor(link, "div")
                 if row:
-                    row_text = row.get_text()
+                    row_text = row.text()
                     # Look for today's date in various formats
-                    if today_str in row_text or date.today().strftime("%b %d") in row_text:
-                        box_url = self.BASE_URL + link.get("href", "")
-                        return self._parse_box_score(player_name, box_url)
+                    if today_str in row_text or today_abbr in row_text:
+                        return self.BASE_URL + (link.attributes.get("href") or "")
 
             logger.debug("No game found today on D1Baseball for %s", team)
             return None
@@ -566,30 +894,15 @@ class D1BaseballScraper(BaseSchoolScraper):
             return None
 
     def _parse_box_score(self, player_name: str, box_url: str) -> Optional[dict]:
-        """Fetch and parse a D1Baseball box score page for a specific player."""
+        """Find a specific player's line in a D1Baseball box score page."""
         try:
-            resp = requests.get(box_url, timeout=15)
-            resp.raise_for_status()
-            soup = BeautifulSoup(resp.text, "html.parser")
-
-            # D1Baseball box scores have tables with player stats
-            # Look for the player's name in the batting or pitching tables
-            tables = soup.select("table")
+            rows = self._box_rows.get(box_url, lambda: self._load_box_rows(box_url))
 
-            for table in tables:
-                rows = table.select("tr")
-                for row in rows:
-                    cells = row.select("td")
-                    if not cells:
-                        continue
-
-                    # First cell typically contains player name
-                    name_cell = cells[0].get_text(strip=True)
-
-                    # Fuzzy match on player name (last name at minimum)
-                    player_last = player_name.split()[-1].lower()
-                    if player_last in name_cell.lower():
-                        return self._extract_stats_from_row(cells, table)
+            # Fuzzy match on player name (last name at minimum)
+            player_last = player_name.split()[-1].lower()
+            for name_cell, cells, headers in rows:
+                if player_last in name_cell:
+                    return self._extract_stats_from_row(cells, headers)
 
             logger.debug("Player %s not found in box score at %s", player_name, box_url)
             return None
@@ -598,12 +911,33 @@ class D1BaseballScraper(BaseSchoolScraper):
             logger.exception("Error parsing D1Baseball box score at %s", box_url)
             return None
 
-    def _extract_stats_from_row(self, cells: list, table) -> Optional[dict]:
+    def _load_box_rows(self, box_url: str) -> list[tuple]:
+        """
+        Fetch a box score page and list its player rows, in page order, as
+        (lowercased name cell, cells, table headers), parsed once for every
+        player in the game.
+        """
+        resp = throttled_get(box_url, timeout=15)
+        resp.raise_for_status()
+        tree = LexborHTMLParser(resp.text)
+
+        # D1Baseball box scores have tables with player stats
+        # Look for the player's name in the batting or pitching tables
+        box_rows = []
+        for table in tree.css("table"):
+            # Batting vs pitching is told apart by the headers, read once per table
+            headers = [th.text(strip=True).upper() for th in table.css("th")]
+            for row in table.css("tr"):
+                cells = row.css("td")
+                if cells:
+                    # First cell typically contains player name
+                    box_rows.append((cells[0].text(strip=True).lower(), cells, headers))
+        return box_rows
+
+    def _extract_stats_from_row(self, cells: list, headers: list) -> Optional[dict]:
         """Extract stats from a box score row. Determines if batting or pitching."""
         try:
             # Detect if this is a batting or pitching table by headers
-            headers = [th.get_text(strip=True).upper() for th in table.select("th")]
-
             if "AB" in headers or "H" in headers:
                 # Batting line
                 return self._parse_batting_row(cells, headers)
@@ -619,34 +953,18 @@ class D1BaseballScraper(BaseSchoolScraper):
 
     def _parse_batting_row(self, cells: list, headers: list) -> dict:
         """Parse a batting stats row."""
-        stats = {}
-        cell_texts = [c.get_text(strip=True) for c in cells]
-
-        # Build a mapping from header to value
-        # Skip first column (player name), align with headers
-        for i, header in enumerate(headers):
-            if i < len(cell_texts):
-                stats[header] = cell_texts[i]
-
-        h = int(stats.get("H", 0) or 0)
-        ab = int(stats.get("AB", 0) or 0)
-        hr = int(stats.get("HR", 0) or 0)
-        rbi = int(stats.get("RBI", 0) or 0)
-        r = int(stats.get("R", 0) or 0)
-        sb = int(stats.get("SB", 0) or 0)
-
-        parts = [f"{h}-{ab}"]
-        if hr:
-            parts.append(f"{hr} HR" if hr > 1 else "HR")
-        if rbi:
-            parts.append(f"{rbi} RBI")
-        if r:
-            parts.append(f"{r} R")
-        if sb:
-            parts.append(f"{sb} SB")
+        # Map header to value, column by column (zip stops at the shorter)
+        stats = dict(zip(headers, [c.text(strip=True) for c in cells]))
+
+        h = _int(stats, "H")
+        ab = _int(stats, "AB")
+        hr = _int(stats, "HR")
+        rbi = _int(stats, "RBI")
+        r = _int(stats, "R")
+        sb = _int(stats, "SB")
 
         return {
-            "stats_summary": ", ".join(parts),
+            "stats_summary": _batting_summary(h, ab, hr, rbi, r, sb),
             "game_status": "Final",
             "game_context": "",  # Would need to parse from page header
             "hits": h,
@@ -659,32 +977,19 @@ class D1BaseballScraper(BaseSchoolScraper):
 
     def _parse_pitching_row(self, cells: list, headers: list) -> dict:
         """Parse a pitching stats row."""
-        stats = {}
-        cell_texts = [c.get_text(strip=True) for c in cells]
-
-        for i, header in enumerate(headers):
-            if i < len(cell_texts):
-                stats[header] = cell_texts[i]
+        stats = dict(zip(headers, [c.text(strip=True) for c in cells]))
 
         ip_str = stats.get("IP", "0") or "0"
         ip = float(ip_str) if ip_str.replace(".", "").isdigit() else 0.0
-        er = int(stats.get("ER", 0) or 0)
+        er = _int(stats, "ER")
         k = int(stats.get("K", stats.get("SO", 0)) or 0)
-        bb = int(stats.get("BB", 0) or 0)
-        ha = int(stats.get("H", 0) or 0)
-
-        parts = [f"{ip_str} IP"]
-        if ha:
-            parts.append(f"{ha} H")
-        parts.append(f"{er} ER")
-        parts.append(f"{k} K")
-        if bb:
-            parts.append(f"{bb} BB")
+        bb = _int(stats, "BB")
+        ha = _int(stats, "H")
 
         qs = ip >= 6.0 and er <= 3
 
         return {
-            "stats_summary": ", ".join(parts),
+            "stats_summary": _pitching_summary(ip_str, ha, er, k, bb),
             "game_status": "Final",
             "game_context": "",
             "is_pitcher_line": True,
@@ -697,6 +1002,16 @@ class D1BaseballScraper(BaseSchoolScraper):
         }
 
 
+# Normalized once at import, so fetch_stats pays one key build per miss
+_SLUG_INDEX: dict[str, str] = {
+    _team_key(name): slug for name, slug in D1BaseballScraper.TEAM_SLUGS.items()
+}
+_SLUG_INDEX.update(
+    (_team_key(alias), D1BaseballScraper.TEAM_SLUGS[name])
+    for alias, name in D1BaseballScraper.TEAM_ALIASES.items()
+)
+
+
 class ESPNScraper(BaseSchoolScraper):
     """
     Scraper using ESPN's public college baseball API.
@@ -715,6 +1030,8 @@ class ESPNScraper(BaseSchoolScraper):
 
     def __init__(self):
         self._scoreboard_cache: Optional[dict] = None
+        # Concurrent fetches share one scoreboard download
+        self._scoreboard_lock = threading.Lock()
 
     def fetch_stats(self, player_name: str, team: str) -> Optional[dict]:
         try:
@@ -740,10 +1057,11 @@ class ESPNScraper(BaseSchoolScraper):
     # ----- internal helpers -----
 
     def _get_scoreboard(self) -> dict:
-        if self._scoreboard_cache is None:
-            resp = requests.get(self.SCOREBOARD_URL, timeout=15)
-            resp.raise_for_status()
-            self._scoreboard_cache = resp.json()
+        with self._scoreboard_lock:
+            if self._scoreboard_cache is None:
+                resp = throttled_get(self.SCOREBOARD_URL, timeout=15)
+                resp.raise_for_status()
+                self._scoreboard_cache = resp.json()
         return self._scoreboard_cache
 
     def _find_game(self, team: str) -> Optional[dict]:
@@ -802,7 +1120,7 @@ class ESPNScraper(BaseSchoolScraper):
         }
 
     def _get_summary(self, game_id: str) -> Optional[dict]:
-        resp = requests.get(
+        resp = throttled_get(
             f"{self.SUMMARY_URL}?event={game_id}", timeout=15
         )
         resp.raise_for_status()
@@ -825,7 +1143,7 @@ class ESPNScraper(BaseSchoolScraper):
             result["game_context"] = f"{away} {a_s}, {home} {hs} | Inn {inning}"
             result["game_status"] = "Live"
         elif status in ("Scheduled", "Pre-Game"):
-            game_time = self._format_espn_time(game_info.get("date", ""))
+            game_time = _format_et_time(game_info.get("date", ""))
             result["game_context"] = f"{away} vs {home}"
             result["game_status"] = "Scheduled"
             if game_time:
@@ -838,19 +1156,6 @@ class ESPNScraper(BaseSchoolScraper):
             result["game_status"] = status
         return result
 
-    @staticmethod
-    def _format_espn_time(date_str: str) -> str:
-        """Convert ESPN ISO date (e.g. '2026-02-13T18:00Z') to ET time string."""
-        if not date_str:
-            return ""
-        try:
-            dt = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-            et_offset = timezone(timedelta(hours=-5))
-            dt_et = dt.astimezone(et_offset)
-            return dt_et.strftime("%-I:%M %p ET")
-        except Exception:
-            return ""
-
     def _find_player(self, player_name: str, summary: dict) -> Optional[dict]:
         """Find a player's stats in the ESPN summary boxscore."""
         boxscore = summary.get("boxscore", {})
@@ -880,28 +1185,16 @@ class ESPNScraper(BaseSchoolScraper):
 
     @staticmethod
     def _parse_batting(sm: dict) -> dict:
-        h = int(sm.get("H", 0) or 0)
-        ab = int(sm.get("AB", 0) or 0)
-        hr = int(sm.get("HR", 0) or 0)
-        rbi = int(sm.get("RBI", 0) or 0)
-        r = int(sm.get("R", 0) or 0)
-        sb = int(sm.get("SB", 0) or 0)
-        bb = int(sm.get("BB", 0) or 0)
-
-        parts = [f"{h}-{ab}"]
-        if hr:
-            parts.append(f"{hr} HR" if hr > 1 else "HR")
-        if rbi:
-            parts.append(f"{rbi} RBI")
-        if r:
-            parts.append(f"{r} R")
-        if sb:
-            parts.append(f"{sb} SB")
-        if bb:
-            parts.append(f"{bb} BB")
+        h = _int(sm, "H")
+        ab = _int(sm, "AB")
+        hr = _int(sm, "HR")
+        rbi = _int(sm, "RBI")
+        r = _int(sm, "R")
+        sb = _int(sm, "SB")
+        bb = _int(sm, "BB")
 
         return {
-            "stats_summary": ", ".join(parts),
+            "stats_summary": _batting_summary(h, ab, hr, rbi, r, sb, bb),
             "hits": h,
             "at_bats": ab,
             "home_runs": hr,
@@ -915,22 +1208,14 @@ class ESPNScraper(BaseSchoolScraper):
     def _parse_pitching(sm: dict) -> dict:
         ip_str = sm.get("IP", "0") or "0"
         ip = float(ip_str) if ip_str.replace(".", "").isdigit() else 0.0
-        h = int(sm.get("H", 0) or 0)
-        er = int(sm.get("ER", 0) or 0)
+        h = _int(sm, "H")
+        er = _int(sm, "ER")
         k = int(sm.get("K", sm.get("SO", 0)) or 0)
-        bb = int(sm.get("BB", 0) or 0)
-
-        parts = [f"{ip_str} IP"]
-        if h:
-            parts.append(f"{h} H")
-        parts.append(f"{er} ER")
-        parts.append(f"{k} K")
-        if bb:
-            parts.append(f"{bb} BB")
+        bb = _int(sm, "BB")
 
         qs = ip >= 6.0 and er <= 3
         return {
-            "stats_summary": ", ".join(parts),
+            "stats_summary": _pitching_summary(ip_str, h, er, k, bb),
             "is_pitcher_line": True,
             "ip": ip,
             "earned_runs": er,
@@ -949,52 +1234,67 @@ class NCAAStatsFetcher:
 
     def __init__(self):
         self._espn = ESPNScraper()
-        self._sidearm = SidearmScraper()
-        self._statbroadcast = StatBroadcastScraper()
-        self._ncaa_org = NCAAOrgScraper()
+        self._feeds = FeedScraper()
         self._d1baseball = D1BaseballScraper()
 
         # Registry: school name -> list of scrapers to try in order.
         # Add school-specific overrides here.
         self._school_scrapers: dict[str, list[BaseSchoolScraper]] = {
             # Example:
-            # "Coastal Carolina": [self._statbroadcast, self._ncaa_org],
+            # "Coastal Carolina": [self._feeds, self._d1baseball],
         }
 
         # Default fallback chain for schools without a specific entry
-        # ESPN first (best: JSON API, all D1, live + final), then HTML scrapers
+        # ESPN first (best: JSON API, all D1, live + final), then the school's
+        # SCHOOL_FEEDS entry if it has one, then D1Baseball's HTML
         self._default_chain: list[BaseSchoolScraper] = [
             self._espn,
-            self._sidearm,
-            self._statbroadcast,
+            self._feeds,
             self._d1baseball,
-            self._ncaa_org,
         ]
 
+        # One pool for every player's scrapers, instead of a fresh set of
+        # threads per fetch() on top of the caller's fetch workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=SCRAPER_WORKERS, thread_name_prefix="ncaa-scraper"
+        )
+
     def fetch(self, player: dict) -> dict:
         """
         Attempt to fetch stats for an NCAA player.
         Tries school-specific scrapers first, then the default chain.
         Never raises — returns empty_stats() on total failure.
+
+        Every scraper in the chain is queued on the shared scraper pool at
+        once, so a slow or timing-out source no longer delays the ones
+        behind it; results are still taken in chain order, and the call
+        returns as soon as one is found. Lower-priority scrapers that
+        haven't started by then are dropped; ones already running can't be
+        interrupted and finish in the background, their results unused.
         """
         name = player.get("player_name", "")
         team = player.get("team", "")
 
         scrapers = self._school_scrapers.get(team, self._default_chain)
 
-        for scraper in scrapers:
-            try:
-                result = scraper.fetch_stats(name, team)
-                if result is not None:
-                    return result
-            except Exception:
-                logger.exception(
-                    "Scraper %s crashed for %s @ %s",
-                    scraper.__class__.__name__,
-                    name,
-                    team,
-                )
-                continue
+        futures = [self._pool.submit(scraper.fetch_stats, name, team) for scraper in scrapers]
+        try:
+            for scraper, future in zip(scrapers, futures):
+                try:
+                    result = future.result()
+                    if result is not None:
+                        return result
+                except Exception:
+                    logger.exception(
+                        "Scraper %s crashed for %s @ %s",
+                        scraper.__class__.__name__,
+                        name,
+                        team,
+                    )
+                    continue
+        finally:
+            for future in futures:
+                future.cancel()  # no-op for scrapers already running or done
 
         logger.info("No NCAA stats found for %s @ %s", name, team)
         return empty_stats()
@@ -1014,6 +1314,14 @@ class StatsFetcher:
         self.pro = ProStatsFetcher()
         self.ncaa = NCAAStatsFetcher()
 
+    def prefetch(self):
+        """Warm the shared per-run caches before players are fetched."""
+        self.pro.prefetch()
+
+    def save_caches(self):
+        """Persist lookups worth keeping across runs (MLB player ids)."""
+        self.pro.save_player_cache()
+
     def fetch(self, player: dict) -> dict:
         level = player.get("level", "")
         if level == "Pro":
@@ -1023,3 +1331,38 @@ class StatsFetcher:
         else:
             logger.warning("Unknown level '%s' for %s", level, player.get("player_name"))
             return empty_stats()
+
+    def fetch_many(self, players: list[dict]) -> list[Optional[dict]]:
+        """
+        Fetch stats for a batch of players concurrently, returned in input
+        order. Pro and NCAA players run on separate pools (they hit
+        different sites), so NCAA fetches parked on a throttled scraper
+        host can't hold up the MLB lookups, or vice versa. Scraper requests
+        stay capped per host by throttled_get.
+
+        A player whose fetch raises is logged and comes back as None, so
+        one failure doesn't abort the rest of the batch.
+        """
+        if not players:
+            return []
+        is_pro = [p.get("level") == "Pro" for p in players]
+        pro_count = sum(is_pro)
+        with (
+            ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, pro_count) or 1) as pro_ex,
+            ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(players) - pro_count) or 1) as ncaa_ex,
+        ):
+            # Today's MLB games load ahead of the Pro queue, without holding
+            # up the NCAA fetches
+            pro_ex.submit(self.prefetch)
+            futures = [
+                (pro_ex if pro else ncaa_ex).submit(self._fetch_or_none, player)
+                for player, pro in zip(players, is_pro)
+            ]
+            return [future.result() for future in futures]
+
+    def _fetch_or_none(self, player: dict) -> Optional[dict]:
+        try:
+            return self.fetch(player)
+        except Exception:
+            logger.exception("Failed to fetch stats for %s", player.get("player_name"))
+            return None
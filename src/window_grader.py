@@ -7,14 +7,9 @@ Uses different thresholds than daily grades:
 - Pitchers graded on ERA
 """
 
-from .config import (
-    WINDOW_HITTER_HOT_OPS,
-    WINDOW_HITTER_SOLID_OPS,
-    WINDOW_HITTER_QUIET_OPS,
-    WINDOW_PITCHER_HOT_ERA,
-    WINDOW_PITCHER_SOLID_ERA,
-    WINDOW_PITCHER_QUIET_ERA,
-)
+from bisect import bisect_left, bisect_right
+
+from .config import WINDOW_HITTER_OPS_CUTOFFS, WINDOW_PITCHER_ERA_CUTOFFS
 
 # Grade labels with emojis
 GRADE_HOT = "🔥 Hot"
@@ -23,6 +18,10 @@ GRADE_QUIET = "😐 Quiet"
 GRADE_COLD = "🥶 Cold"
 GRADE_INSUFFICIENT = "— Insufficient"
 
+# Grade for each bisect slot of the config cutoff tuples
+_HITTER_GRADES = (GRADE_COLD, GRADE_QUIET, GRADE_SOLID, GRADE_HOT)  # OPS ascending
+_PITCHER_GRADES = (GRADE_HOT, GRADE_SOLID, GRADE_QUIET, GRADE_COLD)  # ERA ascending
+
 
 def grade_hitter_window(stats: dict, window: str) -> str:
     """
@@ -34,16 +33,8 @@ def grade_hitter_window(stats: dict, window: str) -> str:
     - Quiet: OPS >= 0.550
     - Cold:  OPS < 0.550
     """
-    ops = stats.get("ops", 0)
-
-    if ops >= WINDOW_HITTER_HOT_OPS:
-        return GRADE_HOT
-    elif ops >= WINDOW_HITTER_SOLID_OPS:
-        return GRADE_SOLID
-    elif ops >= WINDOW_HITTER_QUIET_OPS:
-        return GRADE_QUIET
-    else:
-        return GRADE_COLD
+    # bisect_right: a value equal to a cutoff earns the higher grade (>=)
+    return _HITTER_GRADES[bisect_right(WINDOW_HITTER_OPS_CUTOFFS, stats.get("ops", 0))]
 
 
 def grade_pitcher_window(stats: dict, window: str) -> str:
@@ -56,20 +47,26 @@ def grade_pitcher_window(stats: dict, window: str) -> str:
     - Quiet: ERA <= 5.00
     - Cold:  ERA > 5.00
     """
-    era = stats.get("era", 99)
+    # bisect_left: a value equal to a cutoff earns the better grade (<=)
+    return _PITCHER_GRADES[bisect_left(WINDOW_PITCHER_ERA_CUTOFFS, stats.get("era", 99))]
 
-    if era <= WINDOW_PITCHER_HOT_ERA:
-        return GRADE_HOT
-    elif era <= WINDOW_PITCHER_SOLID_ERA:
-        return GRADE_SOLID
-    elif era <= WINDOW_PITCHER_QUIET_ERA:
-        return GRADE_QUIET
-    else:
-        return GRADE_COLD
+
+# CSS class for each window grade label
+_GRADE_CLASSES = {
+    GRADE_HOT: "grade-hot",
+    GRADE_SOLID: "grade-solid",
+    GRADE_QUIET: "grade-quiet",
+    GRADE_COLD: "grade-cold",
+    GRADE_INSUFFICIENT: "grade-insufficient",
+}
 
 
 def get_grade_class(grade: str) -> str:
     """Return CSS class name for a grade."""
+    grade_class = _GRADE_CLASSES.get(grade)
+    if grade_class is not None:
+        return grade_class
+    # Other labels (e.g. daily "🔥 Standout") are matched by keyword/emoji
     if "Hot" in grade or "🔥" in grade:
         return "grade-hot"
     elif "Solid" in grade or "✅" in grade: